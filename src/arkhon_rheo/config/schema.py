@@ -115,6 +115,10 @@ class MemoryConfig(BaseModel):
     """Agent memory architecture settings."""
 
     project_rag_enabled: bool = Field(default=True)
+    project_index_path: str = Field(
+        default="./.agent/project_index.json",
+        description="Manifest used by ProjectIndexer to re-index only changed files.",
+    )
     episode_log_path: str = Field(default="./.agent/episodes.json")
 
 
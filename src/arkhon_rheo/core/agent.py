@@ -4,10 +4,12 @@ This module defines the abstract base class for all agents in the multi-agent sy
 providing basic message passing and asynchronous execution mechanisms.
 """
 
-import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 from typing import TYPE_CHECKING
 
+from arkhon_rheo.core.inbox import AgentInbox, BackpressurePolicy
+
 if TYPE_CHECKING:
     from arkhon_rheo.core.message import AgentMessage
 
@@ -19,19 +21,34 @@ class Agent(ABC):
     and fundamental communication methods. Each instance automatically
     registers itself with the AgentRegistry upon initialization.
 
+    The inbox is an :class:`~arkhon_rheo.core.inbox.AgentInbox`: messages
+    are received by priority lane (responses before requests by default),
+    and a bounded inbox applies the configured backpressure policy to
+    senders.
+
     Attributes:
         name: Unique identifier for the agent.
         inbox: Asynchronous queue for receiving messages.
     """
 
-    def __init__(self, name: str) -> None:
+    def __init__(
+        self,
+        name: str,
+        *,
+        inbox_size: int = 0,
+        backpressure: BackpressurePolicy | str = BackpressurePolicy.BLOCK,
+        priorities: Mapping[str, int] | None = None,
+    ) -> None:
         """Initialize the Agent instance.
 
         Args:
             name: The name of the agent, must be unique in the Registry.
+            inbox_size: Inbox capacity; 0 means unbounded.
+            backpressure: Policy applied to senders when the inbox is full.
+            priorities: Inbox lane per message type (lower is received first).
         """
         self.name = name
-        self.inbox: asyncio.Queue[AgentMessage] = asyncio.Queue()
+        self.inbox = AgentInbox(name, maxsize=inbox_size, policy=backpressure, priorities=priorities)
 
         # Auto-register
         from arkhon_rheo.core.registry import AgentRegistry  # noqa: PLC0415
@@ -44,6 +61,9 @@ class Agent(ABC):
         Args:
             recipient: The target agent instance to receive the message.
             message: The message object to be sent.
+
+        Raises:
+            InboxFullError: If the recipient's inbox is full and rejects messages.
         """
         await recipient.inbox.put(message)
 
@@ -0,0 +1,199 @@
+"""Agent Inbox Module.
+
+This module provides AgentInbox, the bounded, priority-aware queue behind
+:attr:`Agent.inbox <arkhon_rheo.core.agent.Agent.inbox>`.
+
+Messages are kept in one FIFO lane per priority, so a ``response`` can
+overtake queued ``request`` messages without a heap. When the inbox is
+full, the sender is throttled according to a :class:`BackpressurePolicy`.
+Inbox depth, queueing delay and dropped messages are exported as
+Prometheus metrics labelled by agent name.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Mapping
+from enum import StrEnum
+from typing import Any
+
+from prometheus_client import Counter, Gauge, Histogram
+
+# ---------------------------------------------------------------------------
+# Observability metrics (prometheus-client, already in deps)
+# ---------------------------------------------------------------------------
+
+_INBOX_DEPTH = Gauge(
+    "arkhon_agent_inbox_depth",
+    "Number of messages waiting in an agent inbox.",
+    ["agent"],
+)
+_INBOX_WAIT = Histogram(
+    "arkhon_agent_inbox_wait_seconds",
+    "Time messages spend in an agent inbox before being received.",
+    ["agent"],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+_INBOX_DROPPED = Counter(
+    "arkhon_agent_inbox_dropped_total",
+    "Messages discarded or refused because an agent inbox was full.",
+    ["agent", "reason"],
+)
+
+#: Default lane per message type; lower values are received first.
+DEFAULT_PRIORITIES: dict[str, int] = {"response": 0, "notification": 1, "request": 2}
+
+#: Lane used for message types missing from the priority map.
+DEFAULT_PRIORITY = 1
+
+
+class BackpressurePolicy(StrEnum):
+    """What a sender experiences when the recipient's inbox is full."""
+
+    BLOCK = "block"
+    DROP_OLDEST = "drop-oldest"
+    REJECT = "reject"
+
+
+class InboxFullError(asyncio.QueueFull):
+    """Raised when a message is refused by a full inbox with the REJECT policy."""
+
+
+class AgentInbox(asyncio.Queue):
+    """Bounded multi-lane FIFO queue for agent messages.
+
+    The class plugs into :class:`asyncio.Queue` through its storage hooks, so
+    ``get``/``put``/``join`` semantics and waiter handling are unchanged.
+
+    Backpressure policies (applied only when ``maxsize > 0``):
+        - ``BLOCK``: ``put`` waits until there is room.
+        - ``DROP_OLDEST``: the oldest message of the lowest-priority lane
+          that does not outrank the new message is discarded to make room;
+          if every queued message outranks it, the new message is dropped.
+        - ``REJECT``: ``put`` raises :class:`InboxFullError`.
+
+    Attributes:
+        owner: Name of the agent owning the inbox (metrics label).
+        policy: The backpressure policy.
+        priorities: Mapping of message type to lane (lower is served first).
+        dropped: Number of messages discarded under ``DROP_OLDEST``.
+        rejected: Number of messages refused under ``REJECT``.
+    """
+
+    def __init__(
+        self,
+        owner: str,
+        maxsize: int = 0,
+        policy: BackpressurePolicy | str = BackpressurePolicy.BLOCK,
+        priorities: Mapping[str, int] | None = None,
+    ) -> None:
+        """Initialize an AgentInbox.
+
+        Args:
+            owner: Name of the owning agent.
+            maxsize: Capacity of the inbox; 0 means unbounded.
+            policy: Backpressure policy applied when the inbox is full.
+            priorities: Lane per message type; defaults to
+                :data:`DEFAULT_PRIORITIES`.
+        """
+        self.owner = owner
+        self.policy = BackpressurePolicy(policy)
+        self.priorities = dict(DEFAULT_PRIORITIES if priorities is None else priorities)
+        self.dropped = 0
+        self.rejected = 0
+        self._depth = _INBOX_DEPTH.labels(agent=owner)
+        self._wait = _INBOX_WAIT.labels(agent=owner)
+        super().__init__(maxsize)
+
+    async def put(self, item: Any) -> None:
+        """Put a message into the inbox, applying the backpressure policy.
+
+        Args:
+            item: The message to enqueue.
+
+        Raises:
+            InboxFullError: If the inbox is full and the policy is REJECT.
+        """
+        if self.policy is BackpressurePolicy.BLOCK:
+            await super().put(item)
+        else:
+            self.put_nowait(item)
+
+    def put_nowait(self, item: Any) -> None:
+        """Put a message without waiting, applying the backpressure policy.
+
+        Args:
+            item: The message to enqueue.
+
+        Raises:
+            asyncio.QueueFull: If the inbox is full under the BLOCK policy.
+            InboxFullError: If the inbox is full under the REJECT policy.
+        """
+        if self.full():
+            if self.policy is BackpressurePolicy.REJECT:
+                self.rejected += 1
+                _INBOX_DROPPED.labels(agent=self.owner, reason="rejected").inc()
+                raise InboxFullError(f"Inbox of agent '{self.owner}' is full ({self.maxsize} messages)")
+            if self.policy is BackpressurePolicy.DROP_OLDEST:
+                self.dropped += 1
+                _INBOX_DROPPED.labels(agent=self.owner, reason="dropped").inc()
+                if not self._drop_oldest(self._priority_of(item)):
+                    return
+        super().put_nowait(item)
+
+    # ------------------------------------------------------------------
+    # asyncio.Queue storage hooks
+    # ------------------------------------------------------------------
+
+    def _init(self, maxsize: int) -> None:  # noqa: ARG002
+        self._lanes: dict[int, deque[tuple[float, Any]]] = {}
+        self._order: list[int] = []
+        self._size = 0
+
+    def _qsize(self) -> int:
+        return self._size
+
+    def _put(self, item: Any) -> None:
+        priority = self._priority_of(item)
+        lane = self._lanes.get(priority)
+        if lane is None:
+            lane = self._lanes[priority] = deque()
+            self._order = sorted(self._lanes)
+        lane.append((time.monotonic(), item))
+        self._size += 1
+        self._depth.set(self._size)
+
+    def _get(self) -> Any:
+        for priority in self._order:
+            lane = self._lanes[priority]
+            if lane:
+                enqueued, item = lane.popleft()
+                self._size -= 1
+                self._depth.set(self._size)
+                self._wait.observe(time.monotonic() - enqueued)
+                return item
+        raise asyncio.QueueEmpty
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _priority_of(self, item: Any) -> int:
+        return self.priorities.get(getattr(item, "type", None), DEFAULT_PRIORITY)
+
+    def _drop_oldest(self, incoming: int) -> bool:
+        """Discard one queued message that does not outrank ``incoming``."""
+        for priority in reversed(self._order):
+            if priority < incoming:
+                break
+            lane = self._lanes[priority]
+            if lane:
+                lane.popleft()
+                self._size -= 1
+                self._depth.set(self._size)
+                # Keep join() accounting balanced for the discarded message.
+                self.task_done()
+                return True
+        return False
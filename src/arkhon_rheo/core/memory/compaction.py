@@ -0,0 +1,109 @@
+"""Context Compaction Module.
+
+This module provides the ContextCompactor, which listens for high-watermark
+events from a :class:`ContextWindow` and summarizes the oldest part of the
+history in a background task. By the time the next prompt is assembled the
+window already holds a compact summary, so compression never sits on the
+critical path of a role invocation.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from arkhon_rheo.core.memory.context_window import ContextWindow
+    from arkhon_rheo.core.memory.summarization import Summarizer
+
+logger = logging.getLogger(__name__)
+
+
+class ContextCompactor:
+    """Background summarizer driven by ContextWindow pressure.
+
+    When the window crosses its high watermark, the compactor selects the
+    oldest unpinned messages worth ``current_tokens - target_ratio *
+    max_tokens`` tokens, summarizes them off the caller's path and swaps the
+    segment for the summary. At most one compaction per window runs at a
+    time; messages added meanwhile are unaffected.
+
+    Attributes:
+        window: The context window being compacted.
+        summarizer: Summarizer used to condense the selected segment.
+        target_ratio: Fraction of ``max_tokens`` to aim for after compaction.
+        compactions: Number of compactions applied so far.
+    """
+
+    def __init__(self, window: ContextWindow, summarizer: Summarizer, target_ratio: float = 0.5) -> None:
+        """Initialize a ContextCompactor and subscribe to the window.
+
+        Args:
+            window: The window to watch; its ``high_watermark`` must be set.
+            summarizer: Summarizer used for compaction.
+            target_ratio: Desired fill level after compaction (0-1).
+
+        Raises:
+            ValueError: If the window has no high watermark configured.
+        """
+        if window.high_watermark is None:
+            raise ValueError("ContextCompactor requires a ContextWindow with high_watermark set")
+        self.window = window
+        self.summarizer = summarizer
+        self.target_ratio = target_ratio
+        self.compactions = 0
+        self._task: asyncio.Task[bool] | None = None
+        window.add_listener(self._on_high_watermark)
+
+    @property
+    def is_running(self) -> bool:
+        """Whether a compaction task is currently in flight."""
+        return self._task is not None and not self._task.done()
+
+    async def wait(self) -> None:
+        """Wait for the in-flight compaction, if any, to finish."""
+        if self._task is not None:
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    async def close(self) -> None:
+        """Unsubscribe from the window and cancel any in-flight compaction."""
+        self.window.remove_listener(self._on_high_watermark)
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def _on_high_watermark(self, _window: ContextWindow) -> None:
+        if self.is_running:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            logger.debug("ContextCompactor: no running event loop, skipping compaction")
+            return
+        self._task = loop.create_task(self.compact())
+
+    async def compact(self) -> bool:
+        """Summarize the oldest segment of the window now.
+
+        Returns:
+            True if a summary replaced part of the window.
+        """
+        window = self.window
+        excess = window.current_tokens - int(self.target_ratio * window.max_tokens)
+        segment = window.oldest_segment(excess) if excess > 0 else []
+        if len(segment) < 2:
+            # Replacing a single message with its summary would gain little.
+            return False
+
+        try:
+            summary = await self.summarizer.summarize([msg for _, msg in segment])
+        except Exception:
+            logger.exception("ContextCompactor: summarization failed")
+            return False
+
+        applied = window.replace_segment([seq for seq, _ in segment], summary)
+        if applied:
+            self.compactions += 1
+        return applied
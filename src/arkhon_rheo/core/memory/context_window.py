@@ -7,46 +7,293 @@ remains within specified limits.
 
 from __future__ import annotations
 
+import heapq
+import math
+from collections import OrderedDict, deque
+from collections.abc import Callable
+from enum import StrEnum
 from typing import Any
 
+#: Callable that returns the token count of a piece of text.
+TokenEstimator = Callable[[str], int]
+
+#: Callback invoked with the window when it crosses its high watermark.
+WatermarkListener = Callable[["ContextWindow"], None]
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap local token estimate of roughly four characters per token.
+
+    Args:
+        text: The text to measure.
+
+    Returns:
+        The estimated token count (at least 1 for non-empty text).
+    """
+    return math.ceil(len(text) / 4) if text else 0
+
+
+class EvictionPolicy(StrEnum):
+    """Strategies for choosing which message to drop when over budget."""
+
+    OLDEST = "oldest"
+    LOWEST_PRIORITY = "lowest-priority"
+    KEEP_PINNED = "keep-pinned"
+
 
 class ContextWindow:
     """Implements a sliding window for context management.
 
-    Maintains a list of recent messages and automatically evicts the oldest
-    entries when the total token count exceeds a predefined maximum.
+    Maintains the recent messages and automatically evicts entries when the
+    total token count exceeds a predefined maximum. Messages are held in an
+    insertion-ordered map keyed by a sequence number, so both oldest-first
+    and arbitrary (priority-based) eviction are O(1) / O(log n) and the
+    running token total is updated incrementally.
+
+    Eviction policies:
+        - ``OLDEST``: drop the oldest message, pinned or not.
+        - ``KEEP_PINNED``: drop the oldest message that is not pinned.
+        - ``LOWEST_PRIORITY``: drop the unpinned message with the lowest
+          priority, oldest first among equals.
+
+    Messages with role ``"system"`` are pinned unless stated otherwise.
+
+    When ``high_watermark`` is set, registered listeners are notified once
+    each time the token count rises to ``high_watermark * max_tokens``; the
+    notification re-arms after the count falls back below that level. This
+    lets a background task (see
+    :class:`~arkhon_rheo.core.memory.compaction.ContextCompactor`) compact
+    the history before eviction starts discarding it.
 
     Attributes:
         max_tokens: The maximum number of tokens allowed in the window.
-        messages: A list of message dictionaries currently in the window.
         current_tokens: The current cumulative token count of all messages.
+        policy: The eviction policy in use.
+        tokenizer: Callable used when a message's token count is not given.
+        high_watermark: Fraction of ``max_tokens`` that triggers listeners.
     """
 
-    def __init__(self, max_tokens: int) -> None:
+    def __init__(
+        self,
+        max_tokens: int,
+        policy: EvictionPolicy | str = EvictionPolicy.OLDEST,
+        tokenizer: TokenEstimator | None = None,
+        high_watermark: float | None = None,
+    ) -> None:
         """Initialize a ContextWindow instance.
 
         Args:
             max_tokens: The token limit for this context window.
+            policy: Eviction policy applied when the limit is exceeded.
+            tokenizer: Token counter for messages added without ``tokens``;
+                defaults to :func:`estimate_tokens`.
+            high_watermark: Fraction of ``max_tokens`` (0-1] at which
+                watermark listeners fire; None disables notifications.
         """
         self.max_tokens = max_tokens
-        self.messages: list[dict[str, Any]] = []
+        self.policy = EvictionPolicy(policy)
+        self.tokenizer = tokenizer or estimate_tokens
+        self.high_watermark = high_watermark
         self.current_tokens = 0
 
-    def add_message(self, role: str, content: str, tokens: int) -> None:
+        self._entries: OrderedDict[int, dict[str, Any]] = OrderedDict()
+        self._unpinned: deque[int] = deque()
+        self._by_priority: list[tuple[int, int]] = []
+        self._seq = 0
+        self._snapshot: tuple[dict[str, Any], ...] | None = ()
+        self._listeners: list[WatermarkListener] = []
+        self._above_watermark = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def messages(self) -> list[dict[str, Any]]:
+        """The messages currently in the window, oldest first."""
+        return list(self.snapshot())
+
+    def add_message(
+        self,
+        role: str,
+        content: str,
+        tokens: int | None = None,
+        *,
+        priority: int = 0,
+        pinned: bool | None = None,
+    ) -> None:
         """Add a message to the window and maintain the token limit.
 
         If adding the message causes the token count to exceed max_tokens,
-        older messages are removed until the count is within limits.
+        messages are evicted according to :attr:`policy` until the count is
+        within limits (or only pinned messages remain).
 
         Args:
             role: The role attributed to the message (e.g., "user", "assistant").
             content: The textual content of the message.
-            tokens: The estimated token count for this message.
+            tokens: The token count for this message; estimated with
+                :attr:`tokenizer` when omitted.
+            priority: Relative importance for ``LOWEST_PRIORITY`` eviction.
+            pinned: Protect the message from ``KEEP_PINNED``/``LOWEST_PRIORITY``
+                eviction; defaults to ``role == "system"``.
+        """
+        if tokens is None:
+            tokens = self.tokenizer(content)
+        if pinned is None:
+            pinned = role == "system"
+
+        seq = self._seq
+        self._seq += 1
+        self._insert(seq, role, content, tokens, priority=priority, pinned=pinned)
+        self._evict()
+        self._check_watermark()
+
+    def snapshot(self) -> tuple[dict[str, Any], ...]:
+        """Return the current messages as an immutable sequence.
+
+        The tuple is cached until the window next changes, so repeated
+        prompt assembly between additions costs nothing extra.
+
+        Returns:
+            The messages in the window, oldest first.
         """
-        self.messages.append({"role": role, "content": content, "tokens": tokens})
+        if self._snapshot is None:
+            self._snapshot = tuple(self._entries.values())
+        return self._snapshot
+
+    def add_listener(self, listener: WatermarkListener) -> None:
+        """Register a callback fired when the high watermark is crossed.
+
+        Args:
+            listener: Called synchronously with this window; it must not block.
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: WatermarkListener) -> None:
+        """Unregister a watermark callback (no-op if it is not registered)."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def oldest_segment(self, tokens: int) -> list[tuple[int, dict[str, Any]]]:
+        """Select the oldest unpinned messages covering at least ``tokens`` tokens.
+
+        Args:
+            tokens: Number of tokens the segment should account for.
+
+        Returns:
+            ``(sequence_number, message)`` pairs, oldest first, suitable for
+            :meth:`replace_segment`.
+        """
+        segment: list[tuple[int, dict[str, Any]]] = []
+        total = 0
+        for seq, entry in self._entries.items():
+            if total >= tokens:
+                break
+            if entry["pinned"]:
+                continue
+            segment.append((seq, entry))
+            total += entry["tokens"]
+        return segment
+
+    def replace_segment(self, seqs: list[int], summary: str, tokens: int | None = None) -> bool:
+        """Replace previously selected messages with a single summary message.
+
+        The summary takes the position of the oldest message of the segment
+        that is still in the window. Messages evicted in the meantime are
+        simply skipped.
+
+        Args:
+            seqs: Sequence numbers returned by :meth:`oldest_segment`.
+            summary: Text replacing the segment.
+            tokens: Token count of the summary; estimated when omitted.
+
+        Returns:
+            False if none of the messages remain (the summary is discarded).
+        """
+        present = [seq for seq in seqs if seq in self._entries]
+        if not present:
+            return False
+        if tokens is None:
+            tokens = self.tokenizer(summary)
+        priority = max(self._entries[seq]["priority"] for seq in present)
+        for seq in present:
+            self.current_tokens -= self._entries[seq]["tokens"]
+        for seq in present[1:]:
+            del self._entries[seq]
+        # Re-using the first key keeps the summary at that position.
+        self._insert(present[0], "system", summary, tokens, priority=priority, pinned=False, summary=True)
+        self._evict()
+        self._check_watermark()
+        return True
+
+    def clear(self) -> None:
+        """Remove every message from the window."""
+        self._entries.clear()
+        self._unpinned.clear()
+        self._by_priority.clear()
+        self.current_tokens = 0
+        self._snapshot = ()
+        self._above_watermark = False
+
+    def _insert(
+        self,
+        seq: int,
+        role: str,
+        content: str,
+        tokens: int,
+        *,
+        priority: int,
+        pinned: bool,
+        summary: bool = False,
+    ) -> None:
+        entry: dict[str, Any] = {
+            "role": role,
+            "content": content,
+            "tokens": tokens,
+            "priority": priority,
+            "pinned": pinned,
+        }
+        if summary:
+            entry["summary"] = True
+        self._entries[seq] = entry
         self.current_tokens += tokens
+        if not pinned:
+            if self.policy is EvictionPolicy.KEEP_PINNED:
+                self._unpinned.append(seq)
+            elif self.policy is EvictionPolicy.LOWEST_PRIORITY:
+                heapq.heappush(self._by_priority, (priority, seq))
+        self._snapshot = None
 
-        # Evict oldest messages if exceeding limit
-        while self.current_tokens > self.max_tokens and self.messages:
-            removed = self.messages.pop(0)
+    def _check_watermark(self) -> None:
+        if self.high_watermark is None:
+            return
+        above = self.current_tokens >= self.high_watermark * self.max_tokens
+        if above and not self._above_watermark:
+            self._above_watermark = True
+            for listener in list(self._listeners):
+                listener(self)
+        elif not above:
+            self._above_watermark = False
+
+    def _evict(self) -> None:
+        while self.current_tokens > self.max_tokens and self._entries:
+            seq = self._next_victim()
+            if seq is None:
+                return
+            removed = self._entries.pop(seq)
             self.current_tokens -= removed["tokens"]
+            self._snapshot = None
+
+    def _next_victim(self) -> int | None:
+        if self.policy is EvictionPolicy.OLDEST:
+            return next(iter(self._entries))
+        if self.policy is EvictionPolicy.KEEP_PINNED:
+            while self._unpinned:
+                seq = self._unpinned.popleft()
+                if seq in self._entries:
+                    return seq
+            return None
+        while self._by_priority:
+            _, seq = heapq.heappop(self._by_priority)
+            if seq in self._entries:
+                return seq
+        return None
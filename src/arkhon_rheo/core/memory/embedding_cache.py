@@ -0,0 +1,283 @@
+"""Embedding Cache Module.
+
+This module provides CachedEmbeddings, an :class:`Embeddings` wrapper that
+avoids re-embedding identical text. Inputs are keyed by a content hash and
+served from an in-memory LRU backed by an optional SQLite store; misses from
+concurrent ``embed_text`` calls are coalesced into ``embed_batch`` requests
+on the wrapped backend.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import sqlite3
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+
+from arkhon_rheo.core.memory.embeddings import Embeddings
+
+
+class EmbeddingDiskCache:
+    """Persistent embedding store backed by SQLite.
+
+    Vectors are stored as raw bytes together with their dtype, keyed by the
+    content hash computed in :class:`CachedEmbeddings`.
+
+    Attributes:
+        db_path: The filesystem path to the SQLite database file.
+    """
+
+    # Keep IN (...) lists well below SQLite's host-parameter limit.
+    _MAX_PARAMS = 500
+
+    def __init__(self, db_path: str | Path) -> None:
+        """Initialize the store, creating the table if needed.
+
+        Args:
+            db_path: The path to the SQLite database.
+        """
+        self.db_path = str(db_path)
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS embeddings (
+                    key TEXT PRIMARY KEY,
+                    dtype TEXT,
+                    data BLOB
+                )
+            """)
+
+    def get_many(self, keys: list[str]) -> dict[str, np.ndarray]:
+        """Fetch the stored vectors for the given keys.
+
+        Args:
+            keys: Content hashes to look up.
+
+        Returns:
+            A mapping of the keys that were found to their vectors.
+        """
+        rows: list[tuple[str, str, bytes]] = []
+        with sqlite3.connect(self.db_path) as conn:
+            for start in range(0, len(keys), self._MAX_PARAMS):
+                chunk = keys[start : start + self._MAX_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                rows.extend(
+                    conn.execute(
+                        f"SELECT key, dtype, data FROM embeddings WHERE key IN ({placeholders})",  # noqa: S608
+                        chunk,
+                    ).fetchall()
+                )
+        return {key: np.frombuffer(data, dtype=np.dtype(dtype)) for key, dtype, data in rows}
+
+    def put_many(self, items: dict[str, np.ndarray]) -> None:
+        """Persist vectors keyed by content hash.
+
+        Args:
+            items: Mapping of content hashes to vectors.
+        """
+        if not items:
+            return
+        rows = [(key, vec.dtype.str, np.ascontiguousarray(vec).tobytes()) for key, vec in items.items()]
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany("INSERT OR REPLACE INTO embeddings (key, dtype, data) VALUES (?, ?, ?)", rows)
+
+
+class CachedEmbeddings(Embeddings):
+    """Caching, deduplicating and batching front-end for an Embeddings backend.
+
+    Lookups go LRU -> disk store -> backend. Identical texts within a batch
+    (and texts already being embedded by another caller) are only sent to
+    the backend once. Single ``embed_text`` misses are queued for up to
+    ``max_wait`` seconds and flushed as one ``embed_batch`` call, or sooner
+    once ``max_batch_size`` texts are pending.
+
+    Returned vectors are shared with the cache and are therefore read-only.
+
+    Attributes:
+        backend: The wrapped Embeddings implementation.
+        namespace: Prefix mixed into content hashes (e.g. the model name).
+        cache_size: Maximum number of vectors kept in the in-memory LRU.
+        max_batch_size: Largest batch sent to the backend in one call.
+        max_wait: Seconds to wait for more ``embed_text`` calls before flushing.
+        hits: Number of texts served from the LRU or disk store.
+        misses: Number of texts sent to the backend.
+    """
+
+    def __init__(
+        self,
+        backend: Embeddings,
+        *,
+        namespace: str | None = None,
+        cache_size: int = 10_000,
+        disk_cache: EmbeddingDiskCache | None = None,
+        max_batch_size: int = 64,
+        max_wait: float = 0.005,
+    ) -> None:
+        """Initialize a CachedEmbeddings wrapper.
+
+        Args:
+            backend: The Embeddings implementation to wrap.
+            namespace: Hash namespace; defaults to the backend's class name.
+            cache_size: Capacity of the in-memory LRU.
+            disk_cache: Optional persistent store shared across runs.
+            max_batch_size: Maximum texts per backend ``embed_batch`` call.
+            max_wait: Coalescing window for ``embed_text`` calls, in seconds.
+        """
+        self.backend = backend
+        self.namespace = namespace or type(backend).__name__
+        self.cache_size = cache_size
+        self.disk_cache = disk_cache
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.hits = 0
+        self.misses = 0
+
+        self._lru: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future[np.ndarray]] = {}
+        self._pending: dict[str, str] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flush_tasks: set[asyncio.Task[None]] = set()
+
+    def content_key(self, text: str) -> str:
+        """Return the cache key for a piece of text."""
+        return hashlib.sha256(f"{self.namespace}\0{text}".encode()).hexdigest()
+
+    async def embed_text(self, text: str) -> np.ndarray:
+        key = self.content_key(text)
+        cached = self._lookup([key])
+        if key in cached:
+            return cached[key]
+
+        future = self._inflight.get(key)
+        if future is None:
+            future = self._enqueue(key, text)
+        return await asyncio.shield(future)
+
+    async def embed_batch(self, texts: list[str]) -> list[np.ndarray]:
+        keys = [self.content_key(text) for text in texts]
+        found = self._lookup(list(dict.fromkeys(keys)))
+
+        waiting: dict[str, asyncio.Future[np.ndarray]] = {}
+        missing: dict[str, str] = {}
+        for key, text in zip(keys, texts, strict=True):
+            if key in found or key in waiting or key in missing:
+                continue
+            if key in self._inflight:
+                waiting[key] = self._inflight[key]
+            else:
+                missing[key] = text
+
+        if missing:
+            loop = asyncio.get_running_loop()
+            futures = {key: loop.create_future() for key in missing}
+            self._inflight.update(futures)
+            await self._embed_missing(missing, futures)
+            waiting.update(futures)
+
+        for key, future in waiting.items():
+            found[key] = await asyncio.shield(future)
+        return [found[key] for key in keys]
+
+    async def flush(self) -> None:
+        """Send all queued ``embed_text`` requests to the backend now."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending = self._pending, {}
+        if pending:
+            futures = {key: self._inflight[key] for key in pending}
+            await self._embed_missing(pending, futures)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _enqueue(self, key: str, text: str) -> asyncio.Future[np.ndarray]:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[np.ndarray] = loop.create_future()
+        self._inflight[key] = future
+        self._pending[key] = text
+        if len(self._pending) >= self.max_batch_size:
+            self._schedule_flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_wait, self._schedule_flush)
+        return future
+
+    def _schedule_flush(self) -> None:
+        task = asyncio.get_running_loop().create_task(self.flush())
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _embed_missing(self, missing: dict[str, str], futures: dict[str, asyncio.Future[np.ndarray]]) -> None:
+        keys = list(missing)
+        self.misses += len(keys)
+        try:
+            for start in range(0, len(keys), self.max_batch_size):
+                chunk = keys[start : start + self.max_batch_size]
+                vectors = await self.backend.embed_batch([missing[key] for key in chunk])
+                results = {key: self._freeze(vec) for key, vec in zip(chunk, vectors, strict=True)}
+                self._store(results)
+                for key, vec in results.items():
+                    self._resolve(key, futures[key], vec)
+        except asyncio.CancelledError as exc:
+            for key in keys:
+                self._fail(key, futures[key], exc)
+            raise
+        except Exception as exc:
+            # Waiters receive the error through their futures.
+            for key in keys:
+                self._fail(key, futures[key], exc)
+
+    def _lookup(self, keys: list[str]) -> dict[str, np.ndarray]:
+        found: dict[str, np.ndarray] = {}
+        cold: list[str] = []
+        for key in keys:
+            vec = self._lru.get(key)
+            if vec is None:
+                cold.append(key)
+            else:
+                self._lru.move_to_end(key)
+                found[key] = vec
+        if cold and self.disk_cache is not None:
+            from_disk = {key: self._freeze(vec) for key, vec in self.disk_cache.get_many(cold).items()}
+            for key, vec in from_disk.items():
+                self._remember(key, vec)
+            found.update(from_disk)
+        self.hits += len(found)
+        return found
+
+    def _store(self, results: dict[str, np.ndarray]) -> None:
+        for key, vec in results.items():
+            self._remember(key, vec)
+        if self.disk_cache is not None:
+            self.disk_cache.put_many(results)
+
+    def _remember(self, key: str, vec: np.ndarray) -> None:
+        self._lru[key] = vec
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.cache_size:
+            self._lru.popitem(last=False)
+
+    def _resolve(self, key: str, future: asyncio.Future[np.ndarray], vec: np.ndarray) -> None:
+        self._inflight.pop(key, None)
+        if not future.done():
+            future.set_result(vec)
+
+    def _fail(self, key: str, future: asyncio.Future[np.ndarray], exc: BaseException) -> None:
+        self._inflight.pop(key, None)
+        if future.done():
+            return
+        if isinstance(exc, asyncio.CancelledError):
+            future.cancel()
+        else:
+            future.set_exception(exc)
+            # Mark as retrieved so futures nobody awaits do not log a warning.
+            future.exception()
+
+    @staticmethod
+    def _freeze(vec: np.ndarray) -> np.ndarray:
+        frozen = np.array(vec, copy=True)
+        frozen.setflags(write=False)
+        return frozen
@@ -1,12 +1,17 @@
 """Embeddings Module.
 
 This module defines the abstract base class for text embedding systems used
-within the Arkhon-Rheo framework to convert text into vector representations.
+within the Arkhon-Rheo framework to convert text into vector representations,
+plus a local feature-hashing implementation that needs no network access.
 """
 
 from __future__ import annotations
 
+import re
+import zlib
 from abc import ABC, abstractmethod
+from collections import Counter
+from functools import lru_cache
 
 import numpy as np
 
@@ -41,3 +46,83 @@ class Embeddings(ABC):
             A list of numpy arrays representing the text embeddings.
         """
         pass
+
+
+class HashingEmbeddings(Embeddings):
+    """Deterministic local embeddings built from hashed n-gram features.
+
+    Word tokens and character n-grams are hashed (CRC-32) into ``dim``
+    buckets with a hash-derived sign, summed and L2-normalised. Texts that
+    share vocabulary and sub-word fragments land close together, which is
+    enough for offline retrieval, CI runs and benchmarks. Output depends only
+    on the input text and the constructor arguments, never on the process.
+
+    Attributes:
+        dim: Dimensionality of the produced vectors.
+        ngram_range: Inclusive range of character n-gram lengths.
+        word_weight: Weight of whole-word features relative to n-grams.
+        seed: Hash seed; different seeds give independent feature spaces.
+    """
+
+    _WORD_RE = re.compile(r"\w+")
+
+    def __init__(
+        self,
+        dim: int = 384,
+        ngram_range: tuple[int, int] = (3, 5),
+        word_weight: float = 2.0,
+        seed: int = 0,
+    ) -> None:
+        """Initialize a HashingEmbeddings instance.
+
+        Args:
+            dim: Number of hash buckets (vector dimensionality).
+            ngram_range: Minimum and maximum character n-gram length.
+            word_weight: Weight given to whole-word tokens.
+            seed: Initial CRC value used to seed the hash.
+        """
+        if dim <= 0:
+            raise ValueError("dim must be positive")
+        self.dim = dim
+        self.ngram_range = ngram_range
+        self.word_weight = word_weight
+        self.seed = seed
+
+    async def embed_text(self, text: str) -> np.ndarray:
+        return self._embed(text)
+
+    async def embed_batch(self, texts: list[str]) -> list[np.ndarray]:
+        return [self._embed(text) for text in texts]
+
+    def _embed(self, text: str) -> np.ndarray:
+        counts = Counter(self._WORD_RE.findall(text.lower()))
+        if not counts:
+            return np.zeros(self.dim, dtype=np.float32)
+
+        lo, hi = self.ngram_range
+        hashes: list[int] = []
+        weights: list[float] = []
+        for word, count in counts.items():
+            features = _word_features(word, self.seed, lo, hi)
+            hashes.extend(features)
+            weights.append(self.word_weight * count)
+            weights.extend([float(count)] * (len(features) - 1))
+
+        h = np.asarray(hashes, dtype=np.uint32)
+        # Low bits pick the bucket, the top bit picks the sign.
+        signs = np.where(h >> 31, -1.0, 1.0) * np.asarray(weights)
+        vec = np.bincount((h % self.dim).astype(np.intp), weights=signs, minlength=self.dim)
+        norm = np.linalg.norm(vec)
+        if norm > 0:
+            vec /= norm
+        return vec.astype(np.float32)
+
+
+@lru_cache(maxsize=65536)
+def _word_features(word: str, seed: int, lo: int, hi: int) -> tuple[int, ...]:
+    """Return the CRC-32 hashes of a word and its padded character n-grams."""
+    hashes = [zlib.crc32(word.encode(), seed)]
+    padded = f" {word} ".encode()
+    for n in range(lo, min(hi, len(padded)) + 1):
+        hashes.extend(zlib.crc32(padded[i : i + n], seed) for i in range(len(padded) - n + 1))
+    return tuple(hashes)
@@ -0,0 +1,265 @@
+"""Episode Log Module.
+
+This module provides the EpisodeStore, an append-only log of completed
+workflow runs kept at ``MemoryConfig.episode_log_path``.
+
+Episodes are written as JSON lines into numbered segment files next to the
+configured path (``episodes.json`` -> ``episodes.000001.jsonl``, ...). A new
+segment is started once the active one exceeds ``segment_max_bytes``, so
+appends never rewrite existing data. An in-memory index of byte offsets by
+``thread_id``, ``scheme`` and ``verdict`` (rebuilt by one sequential scan on
+open) serves lookups and time-range queries without reading unrelated
+records.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import re
+import time
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import IO, Any
+
+INDEXED_FIELDS = ("thread_id", "scheme", "verdict")
+
+
+@dataclass
+class Episode:
+    """A single completed workflow run.
+
+    Attributes:
+        thread_id: Session identifier of the run.
+        scheme: RACI workflow scheme that handled the run.
+        verdict: Final verdict (e.g. "approved", "rejected") if any.
+        task: The original task description.
+        timestamp: Completion time as seconds since the epoch.
+        data: Additional payload (message count, errors, results, ...).
+    """
+
+    thread_id: str
+    scheme: str | None = None
+    verdict: str | None = None
+    task: str = ""
+    timestamp: float = field(default_factory=time.time)
+    data: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_state(cls, state: dict[str, Any], timestamp: float | None = None) -> Episode:
+        """Build an episode from a final RACIState/AgentState.
+
+        Args:
+            state: The state returned by a workflow or orchestrator run.
+            timestamp: Completion time; defaults to now.
+
+        Returns:
+            An Episode summarising the run.
+        """
+        ctx = state.get("shared_context", {})
+        scheme = ctx.get("selected_scheme")
+        return cls(
+            thread_id=state.get("thread_id", "default"),
+            scheme=str(scheme) if scheme is not None else None,
+            verdict=ctx.get("verdict"),
+            task=ctx.get("user_request", ""),
+            timestamp=time.time() if timestamp is None else timestamp,
+            data={
+                "messages": len(state.get("messages", [])),
+                "errors": list(state.get("errors", [])),
+                "is_completed": bool(state.get("is_completed", False)),
+            },
+        )
+
+
+class EpisodeStore:
+    """Append-only, segment-rotated JSONL store of :class:`Episode` records.
+
+    Attributes:
+        base_path: The configured episode log path; segments live beside it.
+        segment_max_bytes: Size at which the active segment is rotated.
+    """
+
+    def __init__(self, base_path: str | Path, segment_max_bytes: int = 8 * 1024 * 1024) -> None:
+        """Open (or create) the store and index existing segments.
+
+        Args:
+            base_path: ``MemoryConfig.episode_log_path``.
+            segment_max_bytes: Rotation threshold for segment files.
+        """
+        self.base_path = Path(base_path)
+        self.segment_max_bytes = segment_max_bytes
+        self.base_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Record number -> (segment number, byte offset) and timestamp.
+        self._locations: list[tuple[int, int]] = []
+        self._timestamps: list[float] = []
+        self._time_sorted = True
+        self._index: dict[str, dict[str, list[int]]] = {name: {} for name in INDEXED_FIELDS}
+        self._readers: dict[int, IO[bytes]] = {}
+
+        segments = self._existing_segments()
+        valid_end = 0
+        for number in segments:
+            valid_end = self._scan_segment(number)
+        self._active = segments[-1] if segments else 1
+        self._writer: IO[bytes] = self._segment_path(self._active).open("ab")
+        if self._writer.tell() > valid_end:
+            # Drop a torn final line left by a crash mid-append.
+            self._writer.truncate(valid_end)
+            self._writer.seek(valid_end)
+
+    def __len__(self) -> int:
+        return len(self._locations)
+
+    def __iter__(self) -> Iterator[Episode]:
+        for record in self._time_order(range(len(self._locations))):
+            yield self._read(record)
+
+    def append(self, episode: Episode) -> None:
+        """Append an episode to the active segment.
+
+        Args:
+            episode: The episode to record.
+        """
+        if self._writer.tell() >= self.segment_max_bytes:
+            self._rotate()
+        line = json.dumps(asdict(episode), default=str).encode() + b"\n"
+        offset = self._writer.tell()
+        self._writer.write(line)
+        self._writer.flush()
+        self._add_to_index(self._active, offset, asdict(episode))
+
+    def query(
+        self,
+        *,
+        thread_id: str | None = None,
+        scheme: str | None = None,
+        verdict: str | None = None,
+        since: float | None = None,
+        until: float | None = None,
+        limit: int | None = None,
+    ) -> list[Episode]:
+        """Return episodes matching all given filters, oldest first.
+
+        Args:
+            thread_id: Only episodes of this thread.
+            scheme: Only episodes run under this scheme.
+            verdict: Only episodes with this verdict.
+            since: Inclusive lower bound on ``timestamp``.
+            until: Exclusive upper bound on ``timestamp``.
+            limit: Maximum number of episodes to return (the most recent ones).
+
+        Returns:
+            The matching episodes ordered by timestamp.
+        """
+        records = self._select(
+            {"thread_id": thread_id, "scheme": scheme, "verdict": verdict},
+            since,
+            until,
+        )
+        if limit is not None:
+            records = records[-limit:] if limit > 0 else []
+        return [self._read(record) for record in records]
+
+    def counts(self, field_name: str) -> dict[str, int]:
+        """Count episodes per value of an indexed field.
+
+        Args:
+            field_name: One of ``thread_id``, ``scheme`` or ``verdict``.
+
+        Returns:
+            Mapping of field value to number of episodes.
+        """
+        return {value: len(records) for value, records in self._index[field_name].items()}
+
+    def close(self) -> None:
+        """Close all open segment files."""
+        self._writer.close()
+        for reader in self._readers.values():
+            reader.close()
+        self._readers.clear()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _select(self, filters: dict[str, str | None], since: float | None, until: float | None) -> list[int]:
+        candidates: list[int] | None = None
+        for name, value in filters.items():
+            if value is None:
+                continue
+            matches = self._index[name].get(value, [])
+            candidates = matches if candidates is None else sorted(set(candidates).intersection(matches))
+
+        if since is None and until is None:
+            return self._time_order(range(len(self._locations)) if candidates is None else candidates)
+
+        if self._time_sorted:
+            lo = 0 if since is None else bisect.bisect_left(self._timestamps, since)
+            hi = len(self._timestamps) if until is None else bisect.bisect_left(self._timestamps, until)
+            if candidates is None:
+                return list(range(lo, hi))
+            return [r for r in candidates if lo <= r < hi]
+
+        pool = range(len(self._locations)) if candidates is None else candidates
+        in_range = [
+            r
+            for r in pool
+            if (since is None or self._timestamps[r] >= since) and (until is None or self._timestamps[r] < until)
+        ]
+        return self._time_order(in_range)
+
+    def _time_order(self, records: range | list[int]) -> list[int]:
+        if self._time_sorted:
+            return list(records)
+        return sorted(records, key=self._timestamps.__getitem__)
+
+    def _add_to_index(self, segment: int, offset: int, record: dict[str, Any]) -> None:
+        number = len(self._locations)
+        timestamp = float(record.get("timestamp", 0.0))
+        if self._timestamps and timestamp < self._timestamps[-1]:
+            self._time_sorted = False
+        self._locations.append((segment, offset))
+        self._timestamps.append(timestamp)
+        for name in INDEXED_FIELDS:
+            value = record.get(name)
+            if value is not None:
+                self._index[name].setdefault(str(value), []).append(number)
+
+    def _read(self, record: int) -> Episode:
+        segment, offset = self._locations[record]
+        reader = self._readers.get(segment)
+        if reader is None:
+            reader = self._readers[segment] = self._segment_path(segment).open("rb")
+        reader.seek(offset)
+        return Episode(**json.loads(reader.readline()))
+
+    def _scan_segment(self, number: int) -> int:
+        """Index a segment and return the end offset of its last complete line."""
+        offset = 0
+        with self._segment_path(number).open("rb") as fh:
+            for line in fh:
+                if not line.endswith(b"\n"):
+                    break
+                self._add_to_index(number, offset, json.loads(line))
+                offset += len(line)
+        return offset
+
+    def _rotate(self) -> None:
+        self._writer.close()
+        self._active += 1
+        self._writer = self._segment_path(self._active).open("ab")
+
+    def _segment_path(self, number: int) -> Path:
+        return self.base_path.with_name(f"{self.base_path.stem}.{number:06d}.jsonl")
+
+    def _existing_segments(self) -> list[int]:
+        pattern = re.compile(rf"^{re.escape(self.base_path.stem)}\.(\d{{6}})\.jsonl$")
+        numbers = [
+            int(match.group(1))
+            for path in self.base_path.parent.iterdir()
+            if (match := pattern.match(path.name)) is not None
+        ]
+        return sorted(numbers)
@@ -0,0 +1,257 @@
+"""Project Index Module.
+
+This module provides the ProjectIndexer, which chunks the text files of a
+:class:`~arkhon_rheo.tools.target_project.TargetProject`, embeds the chunks
+and stores them in a :class:`VectorStore` for retrieval.
+
+Indexing is incremental: a JSON manifest records the ``mtime``/size and
+content hash of every indexed file, so a re-run only reads files whose
+metadata changed and only re-embeds files whose content actually changed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+if TYPE_CHECKING:
+    from arkhon_rheo.core.memory.embeddings import Embeddings
+    from arkhon_rheo.core.memory.vector_store import VectorStore
+    from arkhon_rheo.tools.target_project import TargetProject
+
+logger = structlog.get_logger(__name__)
+
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class IndexStats:
+    """Summary of a single :meth:`ProjectIndexer.index` run.
+
+    Attributes:
+        added: Files indexed for the first time.
+        updated: Files whose content changed and were re-embedded.
+        removed: Files deleted from the project and dropped from the store.
+        unchanged: Files skipped because nothing changed.
+        skipped: Files ignored as binary, undecodable or too large.
+        chunks_embedded: Number of chunks sent to the embeddings backend.
+    """
+
+    added: list[str] = field(default_factory=list)
+    updated: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    unchanged: int = 0
+    skipped: int = 0
+    chunks_embedded: int = 0
+
+
+class ProjectIndexer:
+    """Incremental RAG indexer for target-project files.
+
+    The manifest describes what the vector store already contains, so a
+    ``manifest_path`` should only be given together with a store that
+    persists across runs. Without one the manifest is kept in memory and
+    repeated :meth:`index` calls on the same instance are still incremental.
+
+    Attributes:
+        project: The target project to index.
+        embeddings: Backend used to embed chunks and queries.
+        store: Destination vector store.
+        manifest_path: Optional JSON manifest location.
+        chunk_size: Maximum characters per chunk.
+        chunk_overlap: Lines repeated between consecutive chunks.
+        max_file_bytes: Files larger than this are skipped.
+        relative_dir: Sub-directory of the project to index (empty = root).
+    """
+
+    def __init__(
+        self,
+        project: TargetProject,
+        embeddings: Embeddings,
+        store: VectorStore,
+        manifest_path: str | Path | None = None,
+        *,
+        chunk_size: int = 1500,
+        chunk_overlap: int = 2,
+        max_file_bytes: int = 1_000_000,
+        relative_dir: str = "",
+    ) -> None:
+        """Initialize a ProjectIndexer instance.
+
+        Args:
+            project: The target project to index.
+            embeddings: Backend used to embed chunks and queries.
+            store: Destination vector store.
+            manifest_path: JSON manifest location, or None for an in-memory manifest.
+            chunk_size: Maximum characters per chunk.
+            chunk_overlap: Number of trailing lines carried into the next chunk.
+            max_file_bytes: Size limit above which files are skipped.
+            relative_dir: Sub-directory of the project to index.
+        """
+        self.project = project
+        self.embeddings = embeddings
+        self.store = store
+        self.manifest_path = Path(manifest_path) if manifest_path else None
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.max_file_bytes = max_file_bytes
+        self.relative_dir = relative_dir
+        self._files: dict[str, dict[str, Any]] = self._load_manifest()
+
+    async def index(self) -> IndexStats:
+        """Bring the vector store in sync with the project files.
+
+        Returns:
+            An :class:`IndexStats` describing what changed.
+        """
+        stats = IndexStats()
+        current = self.project.scan_files(self.relative_dir)
+        if self.manifest_path is not None:
+            # Never index our own manifest when it lives inside the project.
+            manifest = self.manifest_path.resolve()
+            if self.project.root in manifest.parents:
+                current.pop(manifest.relative_to(self.project.root).as_posix(), None)
+
+        for path in sorted(self._files.keys() - current.keys()):
+            await self._drop_chunks(path, self._files.pop(path)["chunks"])
+            stats.removed.append(path)
+
+        for path, (mtime_ns, size) in sorted(current.items()):
+            entry = self._files.get(path)
+            if entry and entry["mtime_ns"] == mtime_ns and entry["size"] == size:
+                stats.unchanged += 1
+                continue
+            await self._index_file(path, mtime_ns, size, entry, stats)
+
+        self._save_manifest()
+        logger.info(
+            "project_index_updated",
+            added=len(stats.added),
+            updated=len(stats.updated),
+            removed=len(stats.removed),
+            unchanged=stats.unchanged,
+            chunks=stats.chunks_embedded,
+        )
+        return stats
+
+    async def search(self, query: str, top_k: int = 5) -> list[dict[str, Any]]:
+        """Embed a query and return the most similar indexed chunks.
+
+        Args:
+            query: Natural-language or code query.
+            top_k: Number of chunks to return.
+
+        Returns:
+            Vector store results whose metadata carries ``path``, line range and ``text``.
+        """
+        return await self.store.search(await self.embeddings.embed_text(query), top_k=top_k)
+
+    def chunk_text(self, text: str) -> list[dict[str, Any]]:
+        """Split text into line-aligned chunks of at most ``chunk_size`` characters.
+
+        Args:
+            text: File contents.
+
+        Returns:
+            Chunk dictionaries with ``text``, ``start_line`` and ``end_line`` (1-based).
+        """
+        lines = text.splitlines(keepends=True)
+        chunks: list[dict[str, Any]] = []
+        start = 0
+        while start < len(lines):
+            end, length = start, 0
+            while end < len(lines) and (end == start or length + len(lines[end]) <= self.chunk_size):
+                length += len(lines[end])
+                end += 1
+            body = "".join(lines[start:end])
+            if body.strip():
+                chunks.append({"text": body, "start_line": start + 1, "end_line": end})
+            if end >= len(lines):
+                break
+            start = max(end - self.chunk_overlap, start + 1)
+        return chunks
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    async def _index_file(
+        self,
+        path: str,
+        mtime_ns: int,
+        size: int,
+        entry: dict[str, Any] | None,
+        stats: IndexStats,
+    ) -> None:
+        old_chunks = entry["chunks"] if entry else 0
+        text = self._read_text(path, size) if size <= self.max_file_bytes else None
+        if text is None:
+            # Remember skipped files too, so they are not re-read on every run.
+            await self._drop_chunks(path, old_chunks)
+            self._files[path] = {"mtime_ns": mtime_ns, "size": size, "sha256": None, "chunks": 0}
+            stats.skipped += 1
+            return
+
+        digest = hashlib.sha256(text.encode()).hexdigest()
+        if entry and entry["sha256"] == digest:
+            # Touched but not modified: refresh the stat fields only.
+            entry.update(mtime_ns=mtime_ns, size=size)
+            stats.unchanged += 1
+            return
+
+        chunks = self.chunk_text(text)
+        if chunks:
+            vectors = await self.embeddings.embed_batch([chunk["text"] for chunk in chunks])
+            for i, (chunk, vector) in enumerate(zip(chunks, vectors, strict=True)):
+                await self.store.upsert(self._chunk_id(path, i), vector, {"path": path, "chunk": i, **chunk})
+            stats.chunks_embedded += len(chunks)
+        await self._drop_chunks(path, old_chunks, start=len(chunks))
+
+        self._files[path] = {"mtime_ns": mtime_ns, "size": size, "sha256": digest, "chunks": len(chunks)}
+        (stats.updated if entry and entry["sha256"] else stats.added).append(path)
+
+    def _read_text(self, path: str, size: int) -> str | None:
+        try:
+            raw = (self.project.root / path).read_bytes()
+        except OSError:
+            return None
+        if b"\0" in raw[: min(size, 8192)]:
+            return None
+        try:
+            return raw.decode("utf-8")
+        except UnicodeDecodeError:
+            return None
+
+    async def _drop_chunks(self, path: str, count: int, start: int = 0) -> None:
+        for i in range(start, count):
+            await self.store.delete(self._chunk_id(path, i))
+
+    @staticmethod
+    def _chunk_id(path: str, index: int) -> str:
+        return f"{path}#{index}"
+
+    def _load_manifest(self) -> dict[str, dict[str, Any]]:
+        if self.manifest_path is None or not self.manifest_path.exists():
+            return {}
+        try:
+            data = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            logger.warning("project_index_manifest_unreadable", path=str(self.manifest_path))
+            return {}
+        if data.get("version") != MANIFEST_VERSION or data.get("root") != str(self.project.root):
+            return {}
+        return data.get("files", {})
+
+    def _save_manifest(self) -> None:
+        if self.manifest_path is None:
+            return
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"version": MANIFEST_VERSION, "root": str(self.project.root), "files": self._files}
+        tmp = self.manifest_path.with_suffix(self.manifest_path.suffix + ".tmp")
+        tmp.write_text(json.dumps(payload), encoding="utf-8")
+        tmp.replace(self.manifest_path)
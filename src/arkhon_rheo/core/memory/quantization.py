@@ -0,0 +1,234 @@
+"""Vector Quantization Module.
+
+This module provides compact encodings for stored embeddings. Quantizers
+replace float32 vectors with small integer codes and score queries against
+those codes directly (asymmetric distance computation), so the full-precision
+vectors never need to be reconstructed during a scan.
+
+Two schemes are available:
+
+- :class:`ScalarQuantizer`: 8-bit per-dimension quantization (4x smaller).
+- :class:`ProductQuantizer`: k-means codebooks over sub-vectors, one byte
+  per sub-space (``4 * dim / num_subspaces`` times smaller, e.g. 16x for
+  ``num_subspaces = dim / 4``).
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import cast
+
+import numpy as np
+
+
+class Quantizer(ABC):
+    """Abstract base class for embedding quantizers.
+
+    A quantizer must be trained on a representative sample before it can
+    encode vectors. Scores are inner products between a float query and the
+    approximated stored vectors; higher means more similar.
+    """
+
+    @property
+    @abstractmethod
+    def is_trained(self) -> bool:
+        """Whether :meth:`fit` has been called."""
+
+    @property
+    @abstractmethod
+    def code_size(self) -> int:
+        """Number of bytes used to encode one vector."""
+
+    @abstractmethod
+    def fit(self, vectors: np.ndarray) -> None:
+        """Learn the quantization parameters from a sample.
+
+        Args:
+            vectors: A 2-D float array of shape ``(n, dim)``.
+        """
+
+    @abstractmethod
+    def encode(self, vectors: np.ndarray) -> np.ndarray:
+        """Encode a batch of vectors into ``uint8`` codes.
+
+        Args:
+            vectors: A 2-D float array of shape ``(n, dim)``.
+
+        Returns:
+            A ``uint8`` array of shape ``(n, code_size)``.
+        """
+
+    @abstractmethod
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        """Reconstruct approximate float32 vectors from codes.
+
+        Args:
+            codes: A ``uint8`` array of shape ``(n, code_size)``.
+
+        Returns:
+            A float32 array of shape ``(n, dim)``.
+        """
+
+    @abstractmethod
+    def score(self, query: np.ndarray, codes: np.ndarray) -> np.ndarray:
+        """Compute inner products between a query and encoded vectors.
+
+        Args:
+            query: A 1-D float query vector (not quantized).
+            codes: A ``uint8`` array of shape ``(n, code_size)``.
+
+        Returns:
+            A float32 array of ``n`` similarity scores.
+        """
+
+    def _require_trained(self) -> None:
+        if not self.is_trained:
+            raise RuntimeError(f"{type(self).__name__} must be fitted before use.")
+
+
+class ScalarQuantizer(Quantizer):
+    """8-bit scalar quantizer with per-dimension ranges.
+
+    Each dimension is mapped linearly from its trained ``[min, max]`` range
+    onto 256 levels. The query stays in float32 and is folded into the
+    de-quantization: ``q . x ~= q . vmin + (q * scale) . code``.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an untrained ScalarQuantizer."""
+        self._vmin: np.ndarray | None = None
+        self._scale: np.ndarray | None = None
+
+    @property
+    def is_trained(self) -> bool:
+        return self._vmin is not None
+
+    @property
+    def code_size(self) -> int:
+        self._require_trained()
+        return int(np.shape(self._vmin)[0])
+
+    def fit(self, vectors: np.ndarray) -> None:
+        data = np.asarray(vectors, dtype=np.float32)
+        vmin = data.min(axis=0)
+        span = data.max(axis=0) - vmin
+        self._vmin = vmin
+        self._scale = np.where(span > 0, span / 255.0, 1.0).astype(np.float32)
+
+    def encode(self, vectors: np.ndarray) -> np.ndarray:
+        self._require_trained()
+        data = np.asarray(vectors, dtype=np.float32)
+        levels = np.rint((data - self._vmin) / self._scale)
+        return np.clip(levels, 0, 255).astype(np.uint8)
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        self._require_trained()
+        return (codes.astype(np.float32) * self._scale + self._vmin).astype(np.float32)
+
+    def score(self, query: np.ndarray, codes: np.ndarray) -> np.ndarray:
+        self._require_trained()
+        q = np.asarray(query, dtype=np.float32)
+        offset = float(np.dot(q, self._vmin))
+        return codes.astype(np.float32) @ (q * self._scale) + offset
+
+
+class ProductQuantizer(Quantizer):
+    """Product quantizer with per-sub-space k-means codebooks.
+
+    The vector is split into ``num_subspaces`` contiguous sub-vectors and
+    each one is replaced by the index of its nearest centroid (one byte).
+    Queries are scored with a lookup table of sub-query/centroid products,
+    so a scan costs ``num_subspaces`` table reads per stored vector.
+
+    Attributes:
+        num_subspaces: Number of sub-vectors (bytes per code).
+        num_centroids: Centroids per sub-space, at most 256.
+        iterations: k-means iterations used by :meth:`fit`.
+        seed: Seed for centroid initialisation, for reproducible codebooks.
+    """
+
+    def __init__(
+        self,
+        num_subspaces: int,
+        num_centroids: int = 256,
+        iterations: int = 20,
+        seed: int = 0,
+    ) -> None:
+        """Initialize an untrained ProductQuantizer.
+
+        Args:
+            num_subspaces: Number of sub-vectors; must divide the vector dimension.
+            num_centroids: Codebook size per sub-space (1-256).
+            iterations: Number of k-means iterations.
+            seed: Random seed for centroid initialisation.
+        """
+        if not 1 <= num_centroids <= 256:
+            raise ValueError("num_centroids must be between 1 and 256")
+        self.num_subspaces = num_subspaces
+        self.num_centroids = num_centroids
+        self.iterations = iterations
+        self.seed = seed
+        self._codebooks: np.ndarray | None = None
+
+    @property
+    def is_trained(self) -> bool:
+        return self._codebooks is not None
+
+    @property
+    def code_size(self) -> int:
+        return self.num_subspaces
+
+    def fit(self, vectors: np.ndarray) -> None:
+        data = np.asarray(vectors, dtype=np.float32)
+        n, dim = data.shape
+        if dim % self.num_subspaces:
+            raise ValueError(f"Dimension {dim} is not divisible by num_subspaces={self.num_subspaces}")
+        k = min(self.num_centroids, n)
+        rng = np.random.default_rng(self.seed)
+        subs = self._split(data)
+        self._codebooks = np.stack([self._kmeans(sub, k, rng) for sub in subs])
+
+    def encode(self, vectors: np.ndarray) -> np.ndarray:
+        codebooks = self._trained_codebooks()
+        subs = self._split(np.asarray(vectors, dtype=np.float32))
+        codes = [self._assign(sub, centroids) for sub, centroids in zip(subs, codebooks, strict=True)]
+        return np.stack(codes, axis=1).astype(np.uint8)
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        codebooks = self._trained_codebooks()
+        parts = [codebooks[j][codes[:, j]] for j in range(self.num_subspaces)]
+        return np.concatenate(parts, axis=1).astype(np.float32)
+
+    def score(self, query: np.ndarray, codes: np.ndarray) -> np.ndarray:
+        codebooks = self._trained_codebooks()
+        sub_queries = self._split(np.asarray(query, dtype=np.float32)[None, :])
+        # table[j, c] = <q_j, centroid_{j,c}>
+        table = np.stack([centroids @ sub[0] for sub, centroids in zip(sub_queries, codebooks, strict=True)])
+        return table[np.arange(self.num_subspaces), codes].sum(axis=1, dtype=np.float32)
+
+    def _trained_codebooks(self) -> np.ndarray:
+        self._require_trained()
+        return cast("np.ndarray", self._codebooks)
+
+    def _split(self, data: np.ndarray) -> list[np.ndarray]:
+        return np.split(data, self.num_subspaces, axis=1)
+
+    @staticmethod
+    def _assign(sub: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        # argmin ||x - c||^2 == argmin (||c||^2 - 2 x.c)
+        dists = (centroids * centroids).sum(axis=1) - 2.0 * (sub @ centroids.T)
+        return dists.argmin(axis=1)
+
+    def _kmeans(self, sub: np.ndarray, k: int, rng: np.random.Generator) -> np.ndarray:
+        centroids = sub[rng.choice(sub.shape[0], size=k, replace=False)].copy()
+        for _ in range(self.iterations):
+            labels = self._assign(sub, centroids)
+            counts = np.bincount(labels, minlength=k)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sub)
+            filled = counts > 0
+            centroids[filled] = sums[filled] / counts[filled, None]
+        # Pad to the full codebook size so every sub-space has the same shape.
+        if k < self.num_centroids:
+            centroids = np.vstack([centroids, np.repeat(centroids[-1:], self.num_centroids - k, axis=0)])
+        return centroids.astype(np.float32)
@@ -7,8 +7,19 @@ token limits and maintain focus in long conversations.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+CHUNK_PROMPT = "Summarize the following conversation history, preserving all key facts and entities:\n"
+MERGE_PROMPT = (
+    "Merge the following consecutive summaries of one conversation into a single summary, "
+    "preserving all key facts and entities:\n"
+)
+
 
 class Summarizer:
     """Handles context compression using an LLM.
@@ -16,42 +27,135 @@ class Summarizer:
     The summarizer converts a list of messages into a concise summary,
     preserving key facts and entities while reducing the overall token count.
 
+    Long histories are summarized hierarchically: messages are split into
+    fixed-size chunks counted from the start of the list, each chunk is
+    summarized once, and the chunk summaries are merged ``merge_fanout`` at a
+    time, level by level, until one summary remains. Every intermediate
+    summary is cached by the hash of its input, so summarizing an
+    append-only history again only pays for the new tail chunk and the
+    merges on the path above it.
+
+    Clients without ``generate_content_async`` are called on a bounded
+    thread pool so the event loop is never blocked, and independent chunks
+    are summarized in parallel. A timeout cancels the awaiting coroutine
+    and any queued pool work; a blocking call that has already started
+    finishes in its worker thread and its result is discarded.
+
     Attributes:
         llm_client: The LLM client used to perform the summarization.
+        chunk_size: Number of messages summarized per leaf chunk.
+        merge_fanout: Number of summaries combined per merge step.
+        cache_size: Maximum number of cached summaries.
+        timeout: Default per-call timeout in seconds (None disables it).
     """
 
-    def __init__(self, llm_client: Any) -> None:
+    def __init__(
+        self,
+        llm_client: Any,
+        chunk_size: int = 20,
+        merge_fanout: int = 4,
+        cache_size: int = 1024,
+        *,
+        timeout: float | None = None,
+        max_workers: int = 4,
+        executor: ThreadPoolExecutor | None = None,
+    ) -> None:
         """Initialize a Summarizer instance.
 
         Args:
             llm_client: An instance of an LLM client (e.g., Google GenAI Client).
+            chunk_size: Messages per leaf chunk.
+            merge_fanout: Summaries merged per step (at least 2).
+            cache_size: Capacity of the summary cache.
+            timeout: Default timeout applied to each :meth:`summarize` call.
+            max_workers: Size of the thread pool created for sync clients.
+            executor: Shared pool to use instead of creating one; it is not
+                shut down by :meth:`close`.
         """
+        if chunk_size < 1 or merge_fanout < 2:
+            raise ValueError("chunk_size must be >= 1 and merge_fanout >= 2")
         self.llm_client = llm_client
+        self.chunk_size = chunk_size
+        self.merge_fanout = merge_fanout
+        self.cache_size = cache_size
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._cache: OrderedDict[str, str] = OrderedDict()
 
-    async def summarize(self, messages: list[dict[str, Any]]) -> str:
+    async def summarize(self, messages: list[dict[str, Any]], timeout: float | None = None) -> str:
         """Summarize a list of messages into a single string.
 
         Args:
             messages: A list of message dictionaries to summarize.
+            timeout: Seconds allowed for this call; defaults to :attr:`timeout`.
 
         Returns:
             A string containing the summary of the conversation.
+
+        Raises:
+            TimeoutError: If the summary is not ready within the timeout.
         """
         if not messages:
             return ""
+        async with asyncio.timeout(timeout if timeout is not None else self.timeout):
+            return await self._summarize(messages)
+
+    def close(self) -> None:
+        """Shut down the internal thread pool, cancelling queued work."""
+        if self._executor is not None and self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
 
-        lines = [
-            "Summarize the following conversation history, preserving all key facts and entities:\n"
-        ]
-        for msg in messages:
+    async def _summarize(self, messages: list[dict[str, Any]]) -> str:
+        chunks = [messages[i : i + self.chunk_size] for i in range(0, len(messages), self.chunk_size)]
+        level = await asyncio.gather(*(self._summarize_chunk(chunk) for chunk in chunks))
+        while len(level) > 1:
+            groups = [level[i : i + self.merge_fanout] for i in range(0, len(level), self.merge_fanout)]
+            level = await asyncio.gather(*(self._merge(group) for group in groups))
+        return level[0]
+
+    async def _summarize_chunk(self, chunk: list[dict[str, Any]]) -> str:
+        lines = [CHUNK_PROMPT]
+        for msg in chunk:
             lines.append(f"{msg['role']}: {msg['content']}")
+        key = self._key("chunk", [[msg["role"], msg["content"]] for msg in chunk])
+        return await self._cached(key, "\n".join(lines))
+
+    async def _merge(self, summaries: list[str]) -> str:
+        if len(summaries) == 1:
+            return summaries[0]
+        lines = [MERGE_PROMPT]
+        for i, summary in enumerate(summaries, start=1):
+            lines.append(f"Part {i}: {summary}")
+        return await self._cached(self._key("merge", summaries), "\n".join(lines))
 
-        prompt = "\n".join(lines)
+    async def _cached(self, key: str, prompt: str) -> str:
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        summary = await self._generate(prompt)
+        self._cache[key] = summary
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return summary
 
+    async def _generate(self, prompt: str) -> str:
         # Call LLM (assuming the client supports the necessary methods)
         if hasattr(self.llm_client, "generate_content_async"):
             response = await self.llm_client.generate_content_async(prompt)
         else:
-            # Fallback for sync clients
-            response = self.llm_client.generate_content(prompt)
+            # Sync clients run on the pool so the event loop keeps serving other tasks
+            loop = asyncio.get_running_loop()
+            response = await loop.run_in_executor(self._pool(), self.llm_client.generate_content, prompt)
         return response.text
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="summarizer")
+        return self._executor
+
+    @staticmethod
+    def _key(kind: str, payload: Any) -> str:
+        return hashlib.sha256(json.dumps([kind, payload], default=str).encode()).hexdigest()
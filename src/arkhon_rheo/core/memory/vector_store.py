@@ -1,8 +1,19 @@
+"""Vector Store Module.
+
+This module defines the abstract VectorStore interface and an in-memory
+implementation that can optionally keep its embeddings quantized (see
+:mod:`arkhon_rheo.core.memory.quantization`) to reduce memory usage.
+"""
+
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
 from typing import Any
 
 import numpy as np
 
+from arkhon_rheo.core.memory.quantization import Quantizer
+
 
 class VectorStore(ABC):
     """Abstract base class for vector storage and retrieval.
@@ -43,3 +54,188 @@ class VectorStore(ABC):
             item_id: Unique identifier of the vector to delete.
         """
         pass
+
+
+class InMemoryVectorStore(VectorStore):
+    """Cosine-similarity vector store held in contiguous numpy arrays.
+
+    Vectors are L2-normalised on insertion and scanned with a single matrix
+    product per query. When a :class:`Quantizer` is supplied the store keeps
+    float32 rows until :meth:`train` is called, after which every row is
+    replaced by its compact code and queries are scored asymmetrically
+    against the codes.
+
+    With ``rerank_candidates > 0`` the store additionally retains the
+    full-precision rows and re-scores the best ``top_k * rerank_candidates``
+    approximate hits exactly before returning. This recovers most of the
+    recall lost to quantization at the cost of keeping the float32 copies.
+
+    Attributes:
+        dim: Dimensionality of stored vectors.
+        quantizer: Optional quantizer used to compress stored vectors.
+        rerank_candidates: Shortlist multiplier for exact re-ranking (0 disables).
+    """
+
+    _INITIAL_CAPACITY = 64
+
+    def __init__(
+        self,
+        dim: int,
+        quantizer: Quantizer | None = None,
+        rerank_candidates: int = 0,
+    ) -> None:
+        """Initialize an empty InMemoryVectorStore.
+
+        Args:
+            dim: Dimensionality of the vectors that will be stored.
+            quantizer: Optional quantizer; vectors are compressed after :meth:`train`.
+            rerank_candidates: Multiplier of ``top_k`` for the exact re-rank shortlist.
+        """
+        self.dim = dim
+        self.quantizer = quantizer
+        self.rerank_candidates = rerank_candidates
+
+        self._ids: list[str] = []
+        self._metadata: list[dict[str, Any]] = []
+        self._rows: dict[str, int] = {}
+        self._vectors: np.ndarray | None = np.empty((self._INITIAL_CAPACITY, dim), dtype=np.float32)
+        self._codes: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def is_quantized(self) -> bool:
+        """Whether rows are currently stored as quantized codes."""
+        return self._codes is not None
+
+    @property
+    def memory_bytes(self) -> int:
+        """Bytes used by the stored vector payload (codes and/or float rows)."""
+        n = len(self._ids)
+        total = 0
+        if self._codes is not None:
+            total += self._codes[:n].nbytes
+        if self._vectors is not None:
+            total += self._vectors[:n].nbytes
+        return total
+
+    async def train(self, sample: np.ndarray | None = None) -> None:
+        """Fit the quantizer and compress all stored vectors.
+
+        Args:
+            sample: Optional training sample; defaults to the vectors already stored.
+
+        Raises:
+            RuntimeError: If the store was created without a quantizer, or
+                there is nothing to train on.
+        """
+        if self.quantizer is None:
+            raise RuntimeError("InMemoryVectorStore has no quantizer to train.")
+        if self._vectors is None:
+            raise RuntimeError("InMemoryVectorStore is already quantized.")
+        n = len(self._ids)
+        data = self._vectors[:n] if sample is None else self._normalize(np.asarray(sample, dtype=np.float32))
+        if len(data) == 0:
+            raise RuntimeError("Cannot train a quantizer without vectors.")
+
+        self.quantizer.fit(data)
+        codes = np.empty((self._vectors.shape[0], self.quantizer.code_size), dtype=np.uint8)
+        codes[:n] = self.quantizer.encode(self._vectors[:n])
+        self._codes = codes
+        if not self.rerank_candidates:
+            self._vectors = None
+
+    async def upsert(self, item_id: str, vector: np.ndarray, metadata: dict[str, Any]) -> None:
+        row_vec = self._normalize(np.asarray(vector, dtype=np.float32).reshape(1, self.dim))
+        row = self._rows.get(item_id)
+        if row is None:
+            row = len(self._ids)
+            self._ensure_capacity(row + 1)
+            self._ids.append(item_id)
+            self._metadata.append(metadata)
+            self._rows[item_id] = row
+        else:
+            self._metadata[row] = metadata
+
+        if self._vectors is not None:
+            self._vectors[row] = row_vec[0]
+        if self._codes is not None and self.quantizer is not None:
+            self._codes[row] = self.quantizer.encode(row_vec)[0]
+
+    async def search(self, query_vector: np.ndarray, top_k: int = 5) -> list[dict[str, Any]]:
+        n = len(self._ids)
+        if n == 0 or top_k <= 0:
+            return []
+        query = self._normalize(np.asarray(query_vector, dtype=np.float32).reshape(1, self.dim))[0]
+
+        if self._codes is None or self.quantizer is None:
+            scores = self._vectors_view() @ query
+            candidates = self._top(scores, top_k)
+            return self._results(candidates, scores[candidates])
+
+        approx = self.quantizer.score(query, self._codes[:n])
+        if not self.rerank_candidates or self._vectors is None:
+            candidates = self._top(approx, top_k)
+            return self._results(candidates, approx[candidates])
+
+        shortlist = self._top(approx, top_k * self.rerank_candidates)
+        exact = self._vectors[shortlist] @ query
+        order = np.argsort(-exact, kind="stable")[:top_k]
+        return self._results(shortlist[order], exact[order])
+
+    async def delete(self, item_id: str) -> None:
+        row = self._rows.pop(item_id, None)
+        if row is None:
+            return
+        # Swap-remove keeps the arrays dense without shifting every row.
+        last = len(self._ids) - 1
+        if row != last:
+            moved_id = self._ids[last]
+            self._ids[row] = moved_id
+            self._metadata[row] = self._metadata[last]
+            self._rows[moved_id] = row
+            if self._vectors is not None:
+                self._vectors[row] = self._vectors[last]
+            if self._codes is not None:
+                self._codes[row] = self._codes[last]
+        self._ids.pop()
+        self._metadata.pop()
+
+    def _vectors_view(self) -> np.ndarray:
+        if self._vectors is None:
+            raise RuntimeError("Full-precision vectors are not retained by this store.")
+        return self._vectors[: len(self._ids)]
+
+    def _ensure_capacity(self, size: int) -> None:
+        arrays = self._vectors if self._vectors is not None else self._codes
+        if arrays is None or size <= arrays.shape[0]:
+            return
+        capacity = max(size, arrays.shape[0] * 2)
+        if self._vectors is not None:
+            self._vectors = self._grow(self._vectors, capacity)
+        if self._codes is not None:
+            self._codes = self._grow(self._codes, capacity)
+
+    @staticmethod
+    def _grow(array: np.ndarray, capacity: int) -> np.ndarray:
+        grown = np.empty((capacity, array.shape[1]), dtype=array.dtype)
+        grown[: array.shape[0]] = array
+        return grown
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms > 0, norms, 1.0)
+
+    @staticmethod
+    def _top(scores: np.ndarray, k: int) -> np.ndarray:
+        k = min(k, scores.shape[0])
+        part = np.argpartition(-scores, k - 1)[:k]
+        return part[np.argsort(-scores[part], kind="stable")]
+
+    def _results(self, rows: np.ndarray, scores: np.ndarray) -> list[dict[str, Any]]:
+        return [
+            {"item_id": self._ids[row], "score": float(score), "metadata": self._metadata[row]}
+            for row, score in zip(rows.tolist(), scores.tolist(), strict=True)
+        ]
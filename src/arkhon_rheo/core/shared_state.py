@@ -1,34 +1,170 @@
 """Shared State Module.
 
-This module provides a SharedAgentState class that enables thread-safe
-and asynchronous sharing of state data between agents, including
-support for atomic operations via key-level locking.
+This module provides a SharedAgentState class that enables safe
+asynchronous sharing of state data between agents, including
+support for atomic operations via key-level locking, versioned
+compare-and-set updates and change notifications.
+
+Storage is delegated to a :class:`StateBackend`. The default
+:class:`InMemoryStateBackend` serves agents on one event loop; a shared
+backend such as
+:class:`~arkhon_rheo.core.sqlite_state.SQLiteStateBackend` extends the
+same API across worker processes on one host.
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import uuid
+import weakref
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Callable, Iterable, Mapping
 from contextlib import asynccontextmanager
 from typing import Any
 
 
-class SharedAgentState:
-    """Thread-safe shared state for multiple agents.
+class UpdateConflictError(RuntimeError):
+    """Raised when an optimistic update keeps losing to concurrent writers."""
+
+
+class StateBackend(ABC):
+    """Storage behind a :class:`SharedAgentState`.
+
+    Methods are synchronous and must each be atomic: SharedAgentState relies
+    on a single backend call never interleaving with another writer.
+    Versions start at 1 on the first write of a key; 0 means "never set".
+
+    Backends shared between processes set :attr:`is_shared` and implement
+    :meth:`changes_since`, :meth:`try_lock` and :meth:`unlock`.
+    """
+
+    #: Whether other processes may write to the same storage.
+    is_shared: bool = False
+
+    @abstractmethod
+    def get(self, key: str) -> tuple[Any, int]:
+        """Return ``(value, version)`` for a key, ``(None, 0)`` if unset."""
+
+    @abstractmethod
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """Return the values of several keys from one consistent read."""
+
+    @abstractmethod
+    def set_many(self, values: Mapping[str, Any]) -> None:
+        """Write several values at once, bumping each key's version."""
+
+    @abstractmethod
+    def compare_and_set(self, key: str, expected_version: int, value: Any) -> bool:
+        """Write a value only if the key is still at ``expected_version``."""
+
+    def changes_since(self, cursor: int | None) -> tuple[int, list[str]]:  # noqa: ARG002
+        """Report keys written since ``cursor``.
+
+        Args:
+            cursor: A value previously returned by this method, or None to
+                obtain the current position without listing any keys.
+
+        Returns:
+            The new cursor and the keys changed after the old one.
+        """
+        return 0, []
+
+    def try_lock(self, key: str, owner: str, ttl: float) -> bool:  # noqa: ARG002
+        """Try to take the cross-process lock on a key for ``ttl`` seconds."""
+        return True
+
+    def unlock(self, key: str, owner: str) -> None:  # noqa: B027
+        """Release a lock taken with :meth:`try_lock`."""
+
+    def close(self) -> None:  # noqa: B027
+        """Release any resources held by the backend."""
 
-    Provides mechanisms for concurrently accessing and modifying shared
-    data, with support for specific key-based locking to ensure atomicity.
+
+class InMemoryStateBackend(StateBackend):
+    """Process-local backend built on plain dictionaries.
 
     Attributes:
-        _state: Internal storage for shared state data.
-        _lock: Global lock used to manage access to the registry of key locks.
-        _locks: Mapping of specific keys to their respective asyncio Locks.
+        _state: Stored values by key.
+        _versions: Per-key version numbers, incremented on every write.
     """
 
     def __init__(self) -> None:
-        """Initialize a SharedAgentState instance."""
+        """Initialize an empty in-memory backend."""
         self._state: dict[str, Any] = {}
-        self._lock = asyncio.Lock()
-        self._locks: dict[str, asyncio.Lock] = {}
+        self._versions: dict[str, int] = {}
+
+    def get(self, key: str) -> tuple[Any, int]:
+        return self._state.get(key), self._versions.get(key, 0)
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        state = self._state
+        return {key: state.get(key) for key in keys}
+
+    def set_many(self, values: Mapping[str, Any]) -> None:
+        versions = self._versions
+        for key, value in values.items():
+            self._state[key] = value
+            versions[key] = versions.get(key, 0) + 1
+
+    def compare_and_set(self, key: str, expected_version: int, value: Any) -> bool:
+        if self._versions.get(key, 0) != expected_version:
+            return False
+        self.set_many({key: value})
+        return True
+
+
+class SharedAgentState:
+    """Shared state for multiple agents.
+
+    Plain reads and writes are single backend calls with no ``await`` in
+    between, so they are already atomic with respect to other coroutines
+    and take no lock. Multi-step read-modify-write sequences use
+    :meth:`lock`, which hands out one lock per key; unrelated keys never
+    contend with each other. With a shared backend the key lock is also
+    taken in the backend, so it excludes other processes too.
+
+    Per-key locks are held in a weak-value mapping: a lock exists only while
+    some coroutine holds or waits on it, so the lock table does not grow
+    with every key ever touched.
+
+    Every write bumps the key's version number (0 means "never set"). This
+    supports lock-free optimistic updates via :meth:`compare_and_set` and
+    :meth:`update_with`, and drives :meth:`watch` notifications. Writes made
+    through this instance wake watchers immediately; writes from other
+    processes are picked up by polling the backend every ``poll_interval``
+    seconds while at least one watcher is active.
+
+    Attributes:
+        backend: The storage backend.
+        poll_interval: Seconds between polls of a shared backend.
+        lock_ttl: Lease duration of cross-process key locks; a lock held by a
+            crashed process is released after this long.
+        _locks: Weak mapping of keys to their currently live asyncio Locks.
+        _watchers: Per-key wake-up events of active :meth:`watch` iterators.
+    """
+
+    def __init__(
+        self,
+        backend: StateBackend | None = None,
+        *,
+        poll_interval: float = 0.05,
+        lock_ttl: float = 30.0,
+    ) -> None:
+        """Initialize a SharedAgentState instance.
+
+        Args:
+            backend: Storage backend; defaults to a new InMemoryStateBackend.
+            poll_interval: Polling period for shared backends (seconds).
+            lock_ttl: Lease duration for cross-process key locks (seconds).
+        """
+        self.backend = backend if backend is not None else InMemoryStateBackend()
+        self.poll_interval = poll_interval
+        self.lock_ttl = lock_ttl
+        self._owner = uuid.uuid4().hex
+        self._locks: weakref.WeakValueDictionary[str, asyncio.Lock] = weakref.WeakValueDictionary()
+        self._watchers: dict[str, set[asyncio.Event]] = {}
+        self._poller: asyncio.Task[None] | None = None
 
     async def get(self, key: str) -> Any:
         """Retrieve a value from the shared state.
@@ -39,8 +175,7 @@ class SharedAgentState:
         Returns:
             The value associated with the key, or None if it does not exist.
         """
-        async with self._lock:
-            return self._state.get(key)
+        return self.backend.get(key)[0]
 
     async def set(self, key: str, value: Any) -> None:
         """Set a value in the shared state.
@@ -49,8 +184,7 @@ class SharedAgentState:
             key: The key under which to store the value.
             value: The data to be stored.
         """
-        async with self._lock:
-            self._state[key] = value
+        self._write({key: value})
 
     async def update(self, key: str, value: Any) -> None:
         """Update a value in the shared state (identical to set).
@@ -61,6 +195,117 @@ class SharedAgentState:
         """
         await self.set(key, value)
 
+    async def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """Retrieve several values in one consistent read.
+
+        Args:
+            keys: The keys to retrieve.
+
+        Returns:
+            A mapping of each requested key to its value (None if missing).
+        """
+        return self.backend.get_many(keys)
+
+    async def set_many(self, values: Mapping[str, Any]) -> None:
+        """Set several values atomically with respect to other coroutines.
+
+        Args:
+            values: Mapping of keys to the values to store.
+        """
+        self._write(values)
+
+    async def get_versioned(self, key: str) -> tuple[Any, int]:
+        """Retrieve a value together with its version.
+
+        Args:
+            key: The key of the value to retrieve.
+
+        Returns:
+            A ``(value, version)`` tuple; version 0 means the key was never set.
+        """
+        return self.backend.get(key)
+
+    async def compare_and_set(self, key: str, expected_version: int, value: Any) -> bool:
+        """Store a value only if the key is still at ``expected_version``.
+
+        Args:
+            key: The key to write.
+            expected_version: Version obtained from :meth:`get_versioned`.
+            value: The new value.
+
+        Returns:
+            True if the value was written, False if another writer got there first.
+        """
+        if not self.backend.compare_and_set(key, expected_version, value):
+            return False
+        self._notify((key,))
+        return True
+
+    async def update_with(self, key: str, fn: Callable[[Any], Any], *, max_retries: int = 16) -> Any:
+        """Atomically replace a value with ``fn(current_value)``.
+
+        ``fn`` may be a plain function or a coroutine function. The update is
+        optimistic: if another writer changes the key while ``fn`` is
+        awaiting, the result is discarded and ``fn`` runs again on the new
+        value. No lock is held across the call.
+
+        Args:
+            key: The key to update.
+            fn: Computes the new value from the current one (None if unset).
+            max_retries: Attempts before giving up.
+
+        Returns:
+            The value that was stored.
+
+        Raises:
+            UpdateConflictError: If every attempt lost a race.
+        """
+        for _ in range(max_retries):
+            current, version = await self.get_versioned(key)
+            new_value = fn(current)
+            if asyncio.iscoroutine(new_value):
+                new_value = await new_value
+            if await self.compare_and_set(key, version, new_value):
+                return new_value
+        raise UpdateConflictError(f"update_with('{key}') failed after {max_retries} attempts")
+
+    async def watch(self, key: str, *, include_current: bool = False) -> AsyncIterator[tuple[Any, int]]:
+        """Iterate over changes to a key as ``(value, version)`` pairs.
+
+        Notifications are coalesced: a slow consumer sees the latest value
+        rather than every intermediate write, so watchers never buffer
+        unboundedly. The watch is registered when iteration starts; wrap the
+        iterator in :func:`contextlib.aclosing` to unregister it promptly
+        when leaving the loop early.
+
+        Args:
+            key: The key to watch.
+            include_current: Yield the current value first if the key is set.
+
+        Yields:
+            The new value and its version after each change.
+        """
+        event = asyncio.Event()
+        watchers = self._watchers.setdefault(key, set())
+        watchers.add(event)
+        if self.backend.is_shared:
+            self._ensure_poller()
+        current, seen = self.backend.get(key)
+        try:
+            if include_current and seen:
+                yield current, seen
+            while True:
+                await event.wait()
+                event.clear()
+                current, version = self.backend.get(key)
+                if version != seen:
+                    seen = version
+                    yield current, version
+        finally:
+            watchers.discard(event)
+            if not watchers and self._watchers.get(key) is watchers:
+                del self._watchers[key]
+
     @asynccontextmanager
     async def lock(self, key: str):
         """Acquire an asynchronous lock for a specific key.
@@ -75,12 +320,56 @@ class SharedAgentState:
                 val = await shared_state.get("resource_id")
                 await shared_state.set("resource_id", (val or 0) + 1)
         """
-        # Global lock to safely get/create the specific key lock
-        async with self._lock:
-            if key not in self._locks:
-                self._locks[key] = asyncio.Lock()
-            key_lock = self._locks[key]
+        # Holding a strong reference for the duration keeps the lock alive
+        # for every waiter; it disappears once the last one releases it.
+        key_lock = self._locks.get(key)
+        if key_lock is None:
+            key_lock = asyncio.Lock()
+            self._locks[key] = key_lock
 
-        # Acquire the specific key lock
         async with key_lock:
-            yield
+            if not self.backend.is_shared:
+                yield
+                return
+            # Coroutines of this instance queue on the local lock above, so
+            # only one of them at a time polls the backend for the lease.
+            while not self.backend.try_lock(key, self._owner, self.lock_ttl):
+                await asyncio.sleep(self.poll_interval)
+            try:
+                yield
+            finally:
+                self.backend.unlock(key, self._owner)
+
+    async def close(self) -> None:
+        """Stop change polling and close the backend."""
+        if self._poller is not None:
+            self._poller.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._poller
+            self._poller = None
+        self.backend.close()
+
+    def _write(self, values: Mapping[str, Any]) -> None:
+        self.backend.set_many(values)
+        self._notify(values)
+
+    def _notify(self, keys: Iterable[str]) -> None:
+        watchers = self._watchers
+        if not watchers:
+            return
+        for key in keys:
+            for event in watchers.get(key, ()):
+                event.set()
+
+    def _ensure_poller(self) -> None:
+        if self._poller is None or self._poller.done():
+            # Take the cursor now so changes made after the watch registers
+            # are never missed.
+            cursor, _ = self.backend.changes_since(None)
+            self._poller = asyncio.get_running_loop().create_task(self._poll(cursor))
+
+    async def _poll(self, cursor: int) -> None:
+        while self._watchers:
+            await asyncio.sleep(self.poll_interval)
+            cursor, keys = self.backend.changes_since(cursor)
+            self._notify(keys)
@@ -0,0 +1,160 @@
+"""SQLite Shared State Backend Module.
+
+This module provides SQLiteStateBackend, a :class:`StateBackend` that lets
+agents in several worker processes on one host share a
+:class:`~arkhon_rheo.core.shared_state.SharedAgentState`.
+
+The database runs in WAL mode, so readers never block the writer. Values
+are stored as JSON (never pickle) together with a per-key version and a
+global change sequence number used for change notification. Cross-process
+key locks are lease rows that expire after a TTL, so a crashed process
+cannot hold a lock forever.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from arkhon_rheo.core.shared_state import StateBackend
+
+
+class SQLiteStateBackend(StateBackend):
+    """Shared state stored in a local SQLite database in WAL mode.
+
+    Each process (or each SharedAgentState) opens its own backend on the
+    same file. Values must be JSON-serializable.
+
+    Attributes:
+        db_path: The filesystem path to the SQLite database file.
+        busy_timeout: Milliseconds SQLite waits for a competing writer.
+    """
+
+    is_shared = True
+
+    def __init__(self, db_path: str | Path, busy_timeout: int = 5000) -> None:
+        """Open (or create) the shared state database.
+
+        Args:
+            db_path: The path to the SQLite database.
+            busy_timeout: Milliseconds to wait on a locked database.
+        """
+        self.db_path = str(db_path)
+        self.busy_timeout = busy_timeout
+        # Autocommit mode: transactions are opened explicitly below.
+        self._conn = sqlite3.connect(self.db_path, isolation_level=None)
+        self._conn.execute(f"PRAGMA busy_timeout = {int(busy_timeout)}")
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._setup_db()
+
+    def _setup_db(self) -> None:
+        """Create the state and lock tables if they do not exist."""
+        with self._transaction():
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS shared_state (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    version INTEGER NOT NULL,
+                    seq INTEGER NOT NULL
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS shared_state_seq ON shared_state (seq)")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS shared_state_locks (
+                    key TEXT PRIMARY KEY,
+                    owner TEXT NOT NULL,
+                    expires REAL NOT NULL
+                )
+            """)
+
+    def get(self, key: str) -> tuple[Any, int]:
+        row = self._conn.execute("SELECT value, version FROM shared_state WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None, 0
+        return json.loads(row[0]), row[1]
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        result: dict[str, Any] = dict.fromkeys(keys)
+        if not result:
+            return result
+        placeholders = ",".join("?" * len(result))
+        # A single SELECT reads from one WAL snapshot, so the values are consistent.
+        rows = self._conn.execute(
+            f"SELECT key, value FROM shared_state WHERE key IN ({placeholders})",  # noqa: S608
+            list(result),
+        )
+        for key, value in rows:
+            result[key] = json.loads(value)
+        return result
+
+    def set_many(self, values: Mapping[str, Any]) -> None:
+        if not values:
+            return
+        encoded = [(key, json.dumps(value)) for key, value in values.items()]
+        with self._transaction():
+            seq = self._last_seq()
+            self._conn.executemany(
+                """
+                INSERT INTO shared_state (key, value, version, seq) VALUES (?, ?, 1, ?)
+                ON CONFLICT (key) DO UPDATE SET
+                    value = excluded.value, version = version + 1, seq = excluded.seq
+                """,
+                [(key, value, seq + i) for i, (key, value) in enumerate(encoded, start=1)],
+            )
+
+    def compare_and_set(self, key: str, expected_version: int, value: Any) -> bool:
+        encoded = json.dumps(value)
+        with self._transaction():
+            row = self._conn.execute("SELECT version FROM shared_state WHERE key = ?", (key,)).fetchone()
+            if (row[0] if row else 0) != expected_version:
+                return False
+            self._conn.execute(
+                "INSERT OR REPLACE INTO shared_state (key, value, version, seq) VALUES (?, ?, ?, ?)",
+                (key, encoded, expected_version + 1, self._last_seq() + 1),
+            )
+        return True
+
+    def changes_since(self, cursor: int | None) -> tuple[int, list[str]]:
+        if cursor is None:
+            return self._last_seq(), []
+        rows = self._conn.execute("SELECT key, seq FROM shared_state WHERE seq > ? ORDER BY seq", (cursor,)).fetchall()
+        if not rows:
+            return cursor, []
+        return rows[-1][1], [key for key, _ in rows]
+
+    def try_lock(self, key: str, owner: str, ttl: float) -> bool:
+        now = time.time()
+        with self._transaction():
+            self._conn.execute("DELETE FROM shared_state_locks WHERE key = ? AND expires < ?", (key, now))
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO shared_state_locks (key, owner, expires) VALUES (?, ?, ?)",
+                (key, owner, now + ttl),
+            )
+        return cursor.rowcount == 1
+
+    def unlock(self, key: str, owner: str) -> None:
+        self._conn.execute("DELETE FROM shared_state_locks WHERE key = ? AND owner = ?", (key, owner))
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _last_seq(self) -> int:
+        return self._conn.execute("SELECT COALESCE(MAX(seq), 0) FROM shared_state").fetchone()[0]
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        # Taking the write lock up front makes read-then-write sequences
+        # such as compare-and-set atomic across processes.
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self._conn
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
@@ -5,14 +5,21 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 
 from arkhon_rheo.config.schema import RACIWorkflowConfig
+from arkhon_rheo.core.memory.episodes import Episode, EpisodeStore
 from arkhon_rheo.core.state import RACIState
 
 
 class BaseOrchestrator(ABC):
     """Abstract base class for all orchestrators."""
 
-    def __init__(self, config: RACIWorkflowConfig):
+    def __init__(self, config: RACIWorkflowConfig, episode_store: EpisodeStore | None = None):
         self.config = config
+        self.episode_store = episode_store
+
+    def record_episode(self, state: RACIState) -> None:
+        """Append the final state of a run to the episode log, if one is configured."""
+        if self.episode_store is not None:
+            self.episode_store.append(Episode.from_state(dict(state)))
 
     @abstractmethod
     async def run(self, task_description: str) -> RACIState:
@@ -45,6 +45,9 @@ class MetaOrchestrator(BaseOrchestrator):
         except TimeoutError:
             state["errors"].append(f"MetaOrchestrator timed out after {timeout}s for task: {task_description!r}")
             state["is_completed"] = True
+            self.record_episode(state)
             return state
 
-        return cast(RACIState, result)
+        final_state = cast(RACIState, result)
+        self.record_episode(final_state)
+        return final_state
@@ -13,6 +13,7 @@ Observability:
 
 from __future__ import annotations
 
+import os
 import re
 import shlex
 import subprocess
@@ -137,6 +138,49 @@ class TargetProject:
         _OP_COUNTER.labels(operation="list", status="ok").inc()
         return sorted(files)
 
+    #: Directory names skipped by :meth:`scan_files` (VCS metadata, caches, envs).
+    DEFAULT_SCAN_EXCLUDES: frozenset[str] = frozenset(
+        {".git", ".hg", ".svn", "__pycache__", ".venv", "venv", "node_modules", ".mypy_cache", ".ruff_cache"}
+    )
+
+    def scan_files(
+        self,
+        relative_dir: str = "",
+        exclude_dirs: frozenset[str] | None = None,
+    ) -> dict[str, tuple[int, int]]:
+        """Collect file metadata under a directory in one pruned walk.
+
+        Unlike :meth:`list_files`, excluded directories are never descended
+        into, and the ``stat`` result is returned so callers can detect
+        changes without touching file contents.
+
+        Args:
+            relative_dir: Directory relative to ``self.root`` (empty = root).
+            exclude_dirs: Directory names to skip; defaults to
+                :attr:`DEFAULT_SCAN_EXCLUDES`.
+
+        Returns:
+            Mapping of root-relative file paths to ``(mtime_ns, size)``.
+        """
+        base = self._resolve(relative_dir) if relative_dir else self.root
+        if not base.is_dir():
+            return {}
+        excluded = self.DEFAULT_SCAN_EXCLUDES if exclude_dirs is None else exclude_dirs
+
+        files: dict[str, tuple[int, int]] = {}
+        for dirpath, dirnames, filenames in os.walk(base):
+            dirnames[:] = [d for d in dirnames if d not in excluded]
+            parent = Path(dirpath)
+            for name in filenames:
+                path = parent / name
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                files[path.relative_to(self.root).as_posix()] = (st.st_mtime_ns, st.st_size)
+        _OP_COUNTER.labels(operation="scan", status="ok").inc()
+        return files
+
     # ------------------------------------------------------------------
     # Shell execution
     # ------------------------------------------------------------------
@@ -183,6 +183,15 @@ class TestTargetProject:
         files = target.list_files("src")
         assert "src/a.py" in files
 
+    def test_scan_files_prunes_excluded_dirs(self, target: TargetProject, tmp_path: Path) -> None:
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "a.py").write_text("x", encoding="utf-8")
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "HEAD").write_text("ref", encoding="utf-8")
+        files = target.scan_files()
+        assert list(files) == ["src/a.py"]
+        assert files["src/a.py"][1] == 1
+
     def test_command_denied(self, target: TargetProject) -> None:
         with pytest.raises(ShellGuardError):
             target.run_command("rm -rf /")
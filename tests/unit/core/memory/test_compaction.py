@@ -0,0 +1,90 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from arkhon_rheo.core.memory.compaction import ContextCompactor
+from arkhon_rheo.core.memory.context_window import ContextWindow, EvictionPolicy
+from arkhon_rheo.core.memory.summarization import Summarizer
+
+
+def _summarizer(delay: float = 0.0) -> Summarizer:
+    llm = MagicMock()
+
+    async def generate(_prompt: str):
+        await asyncio.sleep(delay)
+        return MagicMock(text="condensed")
+
+    llm.generate_content_async = AsyncMock(side_effect=generate)
+    return Summarizer(llm_client=llm)
+
+
+def test_watermark_listener_is_edge_triggered():
+    window = ContextWindow(max_tokens=100, high_watermark=0.5)
+    events = []
+    window.add_listener(events.append)
+
+    window.add_message("user", "a", tokens=40)
+    window.add_message("user", "b", tokens=20)
+    window.add_message("user", "c", tokens=10)
+
+    assert events == [window]
+
+
+def test_replace_segment_keeps_position_and_tokens():
+    window = ContextWindow(max_tokens=100, policy=EvictionPolicy.KEEP_PINNED)
+    window.add_message("system", "rules", tokens=5)
+    window.add_message("user", "a", tokens=10)
+    window.add_message("assistant", "b", tokens=10)
+    window.add_message("user", "c", tokens=10)
+
+    segment = window.oldest_segment(15)
+    assert [msg["content"] for _, msg in segment] == ["a", "b"]
+
+    assert window.replace_segment([seq for seq, _ in segment], "a and b", tokens=4)
+    assert [m["content"] for m in window.messages] == ["rules", "a and b", "c"]
+    assert window.messages[1]["summary"] is True
+    assert window.current_tokens == 19
+
+
+@pytest.mark.asyncio
+async def test_compactor_runs_in_background_on_pressure():
+    window = ContextWindow(max_tokens=100, high_watermark=0.8)
+    compactor = ContextCompactor(window, _summarizer(delay=0.01), target_ratio=0.3)
+
+    for i in range(9):
+        window.add_message("user", f"message {i}", tokens=10)
+
+    # Crossing the watermark schedules work without blocking add_message.
+    assert compactor.is_running
+    assert len(window) == 9
+
+    await compactor.wait()
+    assert compactor.compactions == 1
+    assert window.messages[0]["content"] == "condensed"
+    assert window.current_tokens <= 30 + 10
+
+    await compactor.close()
+
+
+@pytest.mark.asyncio
+async def test_compactor_discards_summary_when_segment_was_evicted():
+    window = ContextWindow(max_tokens=40, high_watermark=0.75)
+    compactor = ContextCompactor(window, _summarizer(delay=0.05), target_ratio=0.25)
+
+    for i in range(3):
+        window.add_message("user", f"m{i}", tokens=10)
+    assert compactor.is_running
+    await asyncio.sleep(0)  # let the compactor pick its segment (m0, m1)
+    for i in range(3, 8):
+        window.add_message("user", f"m{i}", tokens=10)
+
+    await compactor.wait()
+    assert compactor.compactions == 0
+    assert [m["content"] for m in window.messages] == ["m4", "m5", "m6", "m7"]
+    await compactor.close()
+
+
+def test_compactor_requires_watermark():
+    with pytest.raises(ValueError):
+        ContextCompactor(ContextWindow(max_tokens=10), _summarizer())
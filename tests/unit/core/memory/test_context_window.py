@@ -1,4 +1,4 @@
-from arkhon_rheo.core.memory.context_window import ContextWindow
+from arkhon_rheo.core.memory.context_window import ContextWindow, EvictionPolicy
 
 
 def test_context_window_sliding():
@@ -21,3 +21,47 @@ def test_context_window_sliding():
     assert window.messages[0]["content"] == "Hi"
     assert window.messages[1]["content"] == "World"
     assert window.current_tokens == 7
+
+
+def test_context_window_estimates_tokens_when_omitted():
+    window = ContextWindow(max_tokens=100, tokenizer=lambda text: len(text.split()))
+
+    window.add_message("user", content="three word message")
+
+    assert window.current_tokens == 3
+    assert window.messages[0]["tokens"] == 3
+
+
+def test_context_window_keep_pinned_policy():
+    window = ContextWindow(max_tokens=10, policy=EvictionPolicy.KEEP_PINNED)
+
+    window.add_message("system", content="rules", tokens=4)
+    window.add_message("user", content="a", tokens=3)
+    window.add_message("user", content="b", tokens=3)
+    window.add_message("user", content="c", tokens=3)
+
+    assert [m["content"] for m in window.messages] == ["rules", "b", "c"]
+    assert window.current_tokens == 10
+
+
+def test_context_window_lowest_priority_policy():
+    window = ContextWindow(max_tokens=9, policy="lowest-priority")
+
+    window.add_message("user", content="important", tokens=3, priority=5)
+    window.add_message("tool", content="noise-1", tokens=3, priority=0)
+    window.add_message("tool", content="noise-2", tokens=3, priority=0)
+    window.add_message("user", content="latest", tokens=3, priority=1)
+
+    assert [m["content"] for m in window.messages] == ["important", "noise-2", "latest"]
+
+
+def test_context_window_snapshot_is_cached_until_change():
+    window = ContextWindow(max_tokens=10)
+    window.add_message("user", content="a", tokens=1)
+
+    first = window.snapshot()
+    assert window.snapshot() is first
+
+    window.add_message("user", content="b", tokens=1)
+    assert window.snapshot() is not first
+    assert len(window.snapshot()) == 2
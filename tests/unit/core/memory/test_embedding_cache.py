@@ -0,0 +1,88 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from arkhon_rheo.core.memory.embedding_cache import CachedEmbeddings, EmbeddingDiskCache
+from arkhon_rheo.core.memory.embeddings import Embeddings
+
+
+class CountingEmbeddings(Embeddings):
+    def __init__(self):
+        self.batches: list[list[str]] = []
+
+    async def embed_text(self, text: str) -> np.ndarray:
+        return (await self.embed_batch([text]))[0]
+
+    async def embed_batch(self, texts: list[str]) -> list[np.ndarray]:
+        self.batches.append(list(texts))
+        return [np.array([len(t), ord(t[0])], dtype=np.float32) for t in texts]
+
+
+class FailingEmbeddings(Embeddings):
+    async def embed_text(self, text: str) -> np.ndarray:
+        raise RuntimeError("backend down")
+
+    async def embed_batch(self, texts: list[str]) -> list[np.ndarray]:
+        raise RuntimeError("backend down")
+
+
+@pytest.mark.asyncio
+async def test_batch_dedupes_and_caches():
+    backend = CountingEmbeddings()
+    cached = CachedEmbeddings(backend)
+
+    first = await cached.embed_batch(["aa", "b", "aa"])
+    second = await cached.embed_batch(["b", "aa", "ccc"])
+
+    assert backend.batches == [["aa", "b"], ["ccc"]]
+    assert np.array_equal(first[0], first[2])
+    assert first[0] is second[1]
+    assert not first[0].flags.writeable
+    assert cached.misses == 3
+
+
+@pytest.mark.asyncio
+async def test_concurrent_embed_text_calls_are_coalesced():
+    backend = CountingEmbeddings()
+    cached = CachedEmbeddings(backend, max_wait=0.01)
+
+    results = await asyncio.gather(*(cached.embed_text(t) for t in ["x", "yy", "x", "zzz"]))
+
+    assert backend.batches == [["x", "yy", "zzz"]]
+    assert [r[0] for r in results] == [1, 2, 1, 3]
+
+
+@pytest.mark.asyncio
+async def test_full_batch_flushes_without_waiting():
+    backend = CountingEmbeddings()
+    cached = CachedEmbeddings(backend, max_batch_size=2, max_wait=60)
+
+    await asyncio.wait_for(asyncio.gather(cached.embed_text("a"), cached.embed_text("bb")), timeout=1)
+
+    assert backend.batches == [["a", "bb"]]
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction_falls_back_to_disk(tmp_path):
+    backend = CountingEmbeddings()
+    disk = EmbeddingDiskCache(tmp_path / "embeddings.db")
+    cached = CachedEmbeddings(backend, cache_size=1, disk_cache=disk)
+
+    await cached.embed_batch(["a", "bb"])
+    restarted = CachedEmbeddings(CountingEmbeddings(), disk_cache=disk)
+    vec = await restarted.embed_text("a")
+
+    assert len(cached._lru) == 1
+    assert restarted.backend.batches == []  # type: ignore[attr-defined]
+    assert vec.tolist() == [1.0, 97.0]
+
+
+@pytest.mark.asyncio
+async def test_backend_errors_reach_every_waiter():
+    cached = CachedEmbeddings(FailingEmbeddings(), max_wait=0.001)
+
+    results = await asyncio.gather(cached.embed_text("a"), cached.embed_text("a"), return_exceptions=True)
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert cached._inflight == {}
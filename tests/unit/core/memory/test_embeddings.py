@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from arkhon_rheo.core.memory.embeddings import HashingEmbeddings
+
+
+@pytest.mark.asyncio
+async def test_hashing_embeddings_are_deterministic_and_normalized():
+    first = HashingEmbeddings(dim=128)
+    second = HashingEmbeddings(dim=128)
+
+    a = await first.embed_text("Refactor the vector store")
+    b = (await second.embed_batch(["Refactor the vector store"]))[0]
+
+    assert a.shape == (128,)
+    assert a.dtype == np.float32
+    assert np.array_equal(a, b)
+    assert np.linalg.norm(a) == pytest.approx(1.0, abs=1e-6)
+
+
+@pytest.mark.asyncio
+async def test_hashing_embeddings_rank_related_text_higher():
+    emb = HashingEmbeddings()
+    query, related, unrelated = await emb.embed_batch(
+        [
+            "how does the checkpoint manager persist state",
+            "CheckpointManager persists agent state to SQLite",
+            "the calculator tool evaluates arithmetic expressions",
+        ]
+    )
+
+    assert float(query @ related) > float(query @ unrelated)
+
+
+@pytest.mark.asyncio
+async def test_hashing_embeddings_seed_and_empty_text():
+    text = "same input"
+    assert not np.array_equal(
+        await HashingEmbeddings(seed=0).embed_text(text), await HashingEmbeddings(seed=1).embed_text(text)
+    )
+    assert not (await HashingEmbeddings(dim=16).embed_text("  !! ")).any()
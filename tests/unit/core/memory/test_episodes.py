@@ -0,0 +1,85 @@
+from pathlib import Path
+
+from arkhon_rheo.core.memory.episodes import Episode, EpisodeStore
+
+
+def _episode(i: int, **kwargs) -> Episode:
+    defaults = {
+        "thread_id": f"t{i % 3}",
+        "scheme": "agile" if i % 2 else "critic",
+        "verdict": "approved" if i % 4 == 0 else "rejected",
+        "task": f"task {i}",
+        "timestamp": 1000.0 + i,
+    }
+    return Episode(**{**defaults, **kwargs})
+
+
+def test_append_and_indexed_queries(tmp_path: Path):
+    store = EpisodeStore(tmp_path / "episodes.json")
+    for i in range(12):
+        store.append(_episode(i))
+
+    assert len(store) == 12
+    assert [e.task for e in store.query(thread_id="t1")] == ["task 1", "task 4", "task 7", "task 10"]
+    assert [e.task for e in store.query(thread_id="t0", verdict="approved")] == ["task 0"]
+    assert [e.task for e in store.query(since=1003, until=1006)] == ["task 3", "task 4", "task 5"]
+    assert [e.task for e in store.query(scheme="agile", since=1005, limit=2)] == ["task 9", "task 11"]
+    assert store.counts("verdict") == {"approved": 3, "rejected": 9}
+    store.close()
+
+
+def test_segments_rotate_and_reload(tmp_path: Path):
+    base = tmp_path / "episodes.json"
+    store = EpisodeStore(base, segment_max_bytes=300)
+    for i in range(10):
+        store.append(_episode(i))
+    store.close()
+
+    segments = sorted(p.name for p in tmp_path.glob("episodes.*.jsonl"))
+    assert len(segments) > 1
+    assert segments[0] == "episodes.000001.jsonl"
+
+    reopened = EpisodeStore(base, segment_max_bytes=300)
+    assert len(reopened) == 10
+    reopened.append(_episode(10))
+    assert [e.task for e in reopened.query(thread_id="t1", since=1007)] == ["task 7", "task 10"]
+    reopened.close()
+
+
+def test_torn_final_line_is_discarded(tmp_path: Path):
+    base = tmp_path / "episodes.json"
+    store = EpisodeStore(base)
+    store.append(_episode(0))
+    store.close()
+    with (tmp_path / "episodes.000001.jsonl").open("ab") as fh:
+        fh.write(b'{"thread_id": "t9", "tas')
+
+    reopened = EpisodeStore(base)
+    reopened.append(_episode(1))
+    assert [e.task for e in reopened] == ["task 0", "task 1"]
+    reopened.close()
+
+
+def test_out_of_order_timestamps_are_still_queryable(tmp_path: Path):
+    store = EpisodeStore(tmp_path / "episodes.json")
+    for ts in (5.0, 1.0, 3.0):
+        store.append(_episode(0, timestamp=ts, task=str(ts)))
+
+    assert [e.task for e in store] == ["1.0", "3.0", "5.0"]
+    assert [e.task for e in store.query(since=2.0)] == ["3.0", "5.0"]
+    store.close()
+
+
+def test_episode_from_state():
+    state = {
+        "thread_id": "abc",
+        "messages": [{"role": "human", "content": "hi"}],
+        "shared_context": {"user_request": "build it", "selected_scheme": "critic", "verdict": "approved"},
+        "errors": [],
+        "is_completed": True,
+    }
+    episode = Episode.from_state(state, timestamp=42.0)
+
+    assert (episode.thread_id, episode.scheme, episode.verdict) == ("abc", "critic", "approved")
+    assert episode.task == "build it"
+    assert episode.data["messages"] == 1
@@ -0,0 +1,98 @@
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from arkhon_rheo.config.schema import ConstraintsConfig, TargetProjectConfig
+from arkhon_rheo.core.memory.embeddings import HashingEmbeddings
+from arkhon_rheo.core.memory.project_index import ProjectIndexer
+from arkhon_rheo.core.memory.vector_store import InMemoryVectorStore
+from arkhon_rheo.tools.target_project import TargetProject
+
+
+class CountingEmbeddings(HashingEmbeddings):
+    def __init__(self):
+        super().__init__(dim=64)
+        self.embedded: list[str] = []
+
+    async def embed_batch(self, texts: list[str]) -> list[np.ndarray]:
+        self.embedded.extend(texts)
+        return await super().embed_batch(texts)
+
+
+def _project(root: Path) -> TargetProject:
+    return TargetProject(TargetProjectConfig(target_path="."), ConstraintsConfig(), base_dir=root)
+
+
+def _indexer(root: Path, embeddings=None, **kwargs) -> ProjectIndexer:
+    return ProjectIndexer(
+        _project(root),
+        embeddings or CountingEmbeddings(),
+        InMemoryVectorStore(dim=64),
+        root / ".agent" / "project_index.json",
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def project_dir(tmp_path: Path) -> Path:
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "store.py").write_text("class CheckpointManager:\n    pass\n", encoding="utf-8")
+    (tmp_path / "src" / "calc.py").write_text("def add(a, b):\n    return a + b\n", encoding="utf-8")
+    (tmp_path / "logo.png").write_bytes(b"\x89PNG\0\0binary")
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "HEAD").write_text("ref: refs/heads/main", encoding="utf-8")
+    return tmp_path
+
+
+@pytest.mark.asyncio
+async def test_initial_index_and_search(project_dir: Path):
+    indexer = _indexer(project_dir)
+    stats = await indexer.index()
+
+    assert stats.added == ["src/calc.py", "src/store.py"]
+    assert stats.skipped == 1
+    results = await indexer.search("CheckpointManager", top_k=1)
+    assert results[0]["metadata"]["path"] == "src/store.py"
+    assert results[0]["metadata"]["start_line"] == 1
+
+
+@pytest.mark.asyncio
+async def test_rerun_only_processes_changed_files(project_dir: Path):
+    await _indexer(project_dir).index()
+
+    (project_dir / "src" / "calc.py").write_text("def sub(a, b):\n    return a - b\n", encoding="utf-8")
+    store_py = project_dir / "src" / "store.py"
+    os.utime(store_py, ns=(store_py.stat().st_atime_ns, store_py.stat().st_mtime_ns + 10_000_000))
+    (project_dir / "src" / "new.py").write_text("X = 1\n", encoding="utf-8")
+
+    embeddings = CountingEmbeddings()
+    stats = await _indexer(project_dir, embeddings).index()
+
+    assert stats.updated == ["src/calc.py"]
+    assert stats.added == ["src/new.py"]
+    assert stats.unchanged == 2  # touched store.py and the skipped png
+    assert embeddings.embedded == ["def sub(a, b):\n    return a - b\n", "X = 1\n"]
+
+
+@pytest.mark.asyncio
+async def test_removed_and_shrunk_files_drop_their_chunks(project_dir: Path):
+    indexer = _indexer(project_dir, chunk_size=20, chunk_overlap=0)
+    await indexer.index()
+    assert len(indexer.store) == 4  # type: ignore[arg-type]
+
+    (project_dir / "src" / "calc.py").unlink()
+    (project_dir / "src" / "store.py").write_text("X = 1\n", encoding="utf-8")
+    stats = await indexer.index()
+
+    assert stats.removed == ["src/calc.py"]
+    assert len(indexer.store) == 1  # type: ignore[arg-type]
+
+
+def test_chunk_text_respects_size_and_overlap(tmp_path: Path):
+    indexer = _indexer(tmp_path, chunk_size=12, chunk_overlap=1)
+    chunks = indexer.chunk_text("aaaa\nbbbb\ncccc\ndddd\n")
+
+    assert [(c["start_line"], c["end_line"]) for c in chunks] == [(1, 2), (2, 3), (3, 4)]
+    assert all(len(c["text"]) <= 12 for c in chunks)
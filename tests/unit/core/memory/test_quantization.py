@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+
+from arkhon_rheo.core.memory.quantization import ProductQuantizer, ScalarQuantizer
+from arkhon_rheo.core.memory.vector_store import InMemoryVectorStore
+
+DIM = 64
+
+
+def _clustered(n: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(32, DIM))
+    data = centers[rng.integers(0, 32, size=n)] + 0.3 * rng.normal(size=(n, DIM))
+    return (data / np.linalg.norm(data, axis=1, keepdims=True)).astype(np.float32)
+
+
+async def _recall_at_10(store: InMemoryVectorStore, data: np.ndarray, queries: np.ndarray) -> float:
+    hits = 0
+    for q in queries:
+        exact = set(np.argsort(-(data @ q))[:10].tolist())
+        found = {int(r["item_id"]) for r in await store.search(q, top_k=10)}
+        hits += len(exact & found)
+    return hits / (10 * len(queries))
+
+
+async def _filled_store(data: np.ndarray, **kwargs) -> InMemoryVectorStore:
+    store = InMemoryVectorStore(dim=DIM, **kwargs)
+    for i, vec in enumerate(data):
+        await store.upsert(str(i), vec, {"row": i})
+    return store
+
+
+def test_scalar_quantizer_roundtrip_error_is_small():
+    data = _clustered(200)
+    sq = ScalarQuantizer()
+    sq.fit(data)
+    codes = sq.encode(data)
+    assert codes.dtype == np.uint8
+    assert codes.shape == (200, DIM)
+    assert np.abs(sq.decode(codes) - data).max() < 0.01
+
+
+def test_asymmetric_scores_match_decoded_inner_product():
+    data = _clustered(300)
+    query = data[0]
+    for quantizer in (ScalarQuantizer(), ProductQuantizer(num_subspaces=16)):
+        quantizer.fit(data)
+        codes = quantizer.encode(data)
+        expected = quantizer.decode(codes) @ query
+        np.testing.assert_allclose(quantizer.score(query, codes), expected, rtol=1e-4, atol=1e-4)
+
+
+def test_untrained_quantizer_raises():
+    with pytest.raises(RuntimeError):
+        ScalarQuantizer().encode(np.zeros((1, DIM)))
+    with pytest.raises(ValueError):
+        ProductQuantizer(num_subspaces=5).fit(np.zeros((10, DIM)))
+
+
+@pytest.mark.asyncio
+async def test_quantized_store_memory_and_recall():
+    data = _clustered(2000)
+    queries = _clustered(20, seed=1)
+
+    exact_store = await _filled_store(data)
+    sq_store = await _filled_store(data, quantizer=ScalarQuantizer())
+    pq_store = await _filled_store(data, quantizer=ProductQuantizer(num_subspaces=16))
+    pq_rerank = await _filled_store(data, quantizer=ProductQuantizer(num_subspaces=16), rerank_candidates=4)
+    for store in (sq_store, pq_store, pq_rerank):
+        await store.train()
+
+    assert exact_store.memory_bytes == 4 * sq_store.memory_bytes
+    assert exact_store.memory_bytes == 16 * pq_store.memory_bytes
+
+    assert await _recall_at_10(exact_store, data, queries) == 1.0
+    assert await _recall_at_10(sq_store, data, queries) >= 0.9
+    assert await _recall_at_10(pq_store, data, queries) >= 0.4
+    assert await _recall_at_10(pq_rerank, data, queries) >= 0.9
+
+
+@pytest.mark.asyncio
+async def test_quantized_store_upsert_and_delete_after_training():
+    data = _clustered(300)
+    store = await _filled_store(data, quantizer=ScalarQuantizer())
+    await store.train()
+    assert store.is_quantized
+
+    await store.upsert("new", data[5], {"text": "fresh"})
+    await store.delete("5")
+    results = await store.search(data[5], top_k=1)
+
+    assert len(store) == 300
+    assert results[0]["item_id"] == "new"
+    assert results[0]["metadata"]["text"] == "fresh"
@@ -1,3 +1,5 @@
+import asyncio
+import time
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -29,3 +31,88 @@ async def test_summarizer_trigger():
     # Assert
     assert summary == "Summary of previous facts."
     mock_llm.generate_content_async.assert_called_once()
+
+
+def _echo_llm():
+    """LLM mock whose summary reveals which prompt produced it."""
+    llm = MagicMock()
+
+    async def generate(prompt: str):
+        kind = "merge" if prompt.startswith("Merge") else "chunk"
+        return MagicMock(text=f"{kind}({prompt.splitlines()[-1]})")
+
+    llm.generate_content_async = AsyncMock(side_effect=generate)
+    return llm
+
+
+def _messages(n: int) -> list[dict[str, str]]:
+    return [{"role": "user", "content": f"fact {i}"} for i in range(n)]
+
+
+@pytest.mark.asyncio
+async def test_summarizer_merges_chunks_hierarchically():
+    llm = _echo_llm()
+    summarizer = Summarizer(llm_client=llm, chunk_size=2, merge_fanout=2)
+
+    summary = await summarizer.summarize(_messages(8))
+
+    # 4 leaf chunks + 2 merges + 1 root merge
+    assert llm.generate_content_async.call_count == 7
+    assert summary.startswith("merge")
+
+
+@pytest.mark.asyncio
+async def test_summarizer_only_pays_for_new_messages():
+    llm = _echo_llm()
+    summarizer = Summarizer(llm_client=llm, chunk_size=4, merge_fanout=4)
+    history = _messages(16)
+
+    await summarizer.summarize(history)
+    first_calls = llm.generate_content_async.call_count
+    await summarizer.summarize(history)
+    assert llm.generate_content_async.call_count == first_calls
+
+    await summarizer.summarize([*history, *_messages(2)])
+    # One new leaf chunk plus one root merge; the full first group is cached.
+    assert llm.generate_content_async.call_count == first_calls + 2
+
+
+class BlockingLLM:
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    def generate_content(self, prompt: str):
+        time.sleep(self.delay)
+        return MagicMock(text=f"summary of {len(prompt)} chars")
+
+
+@pytest.mark.asyncio
+async def test_sync_client_runs_off_the_event_loop_in_parallel():
+    summarizer = Summarizer(llm_client=BlockingLLM(delay=0.2), max_workers=4)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    ticking = asyncio.create_task(ticker())
+    start = time.perf_counter()
+    summaries = await asyncio.gather(*(summarizer.summarize(_messages(n)) for n in range(1, 5)))
+    elapsed = time.perf_counter() - start
+    ticking.cancel()
+    summarizer.close()
+
+    assert len(set(summaries)) == 4
+    assert elapsed < 0.6
+    assert ticks >= 5
+
+
+@pytest.mark.asyncio
+async def test_summarize_timeout():
+    summarizer = Summarizer(llm_client=BlockingLLM(delay=0.5), timeout=0.05)
+
+    with pytest.raises(TimeoutError):
+        await summarizer.summarize(_messages(3))
+    summarizer.close()
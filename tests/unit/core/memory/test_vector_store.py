@@ -3,7 +3,7 @@ from typing import Any
 import numpy as np
 import pytest
 
-from arkhon_rheo.core.memory.vector_store import VectorStore
+from arkhon_rheo.core.memory.vector_store import InMemoryVectorStore, VectorStore
 
 
 class MockVectorStore(VectorStore):
@@ -43,3 +43,20 @@ async def test_vector_store_basic():
     # Assert
     assert results[0]["item_id"] == "1"
     assert results[0]["metadata"]["text"] == "A"
+
+
+@pytest.mark.asyncio
+async def test_in_memory_vector_store_upsert_search_delete():
+    store = InMemoryVectorStore(dim=2)
+
+    await store.upsert("1", np.array([1.0, 0.0]), {"text": "A"})
+    await store.upsert("2", np.array([0.0, 1.0]), {"text": "B"})
+    await store.upsert("2", np.array([0.0, 2.0]), {"text": "B2"})
+
+    results = await store.search(np.array([0.9, 0.1]), top_k=5)
+    assert [r["item_id"] for r in results] == ["1", "2"]
+    assert results[1]["metadata"]["text"] == "B2"
+
+    await store.delete("1")
+    results = await store.search(np.array([0.9, 0.1]))
+    assert [r["item_id"] for r in results] == ["2"]
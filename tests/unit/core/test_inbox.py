@@ -0,0 +1,77 @@
+import asyncio
+
+import pytest
+from prometheus_client import REGISTRY
+
+from arkhon_rheo.core.inbox import AgentInbox, BackpressurePolicy, InboxFullError
+from arkhon_rheo.core.message import AgentMessage
+
+
+def _msg(content, type_="request"):
+    return AgentMessage(sender="s", receiver="r", content=content, type=type_)
+
+
+@pytest.mark.asyncio
+async def test_inbox_responses_overtake_requests():
+    inbox = AgentInbox("lanes")
+    for item in [_msg("req-1"), _msg("note", "notification"), _msg("req-2"), _msg("resp", "response")]:
+        await inbox.put(item)
+
+    received = [(await inbox.get()).content for _ in range(4)]
+
+    assert received == ["resp", "note", "req-1", "req-2"]
+    assert inbox.empty()
+
+
+@pytest.mark.asyncio
+async def test_inbox_block_policy_waits_for_room():
+    inbox = AgentInbox("block", maxsize=1)
+    await inbox.put(_msg(1))
+    blocked = asyncio.create_task(inbox.put(_msg(2)))
+    await asyncio.sleep(0)
+    assert not blocked.done()
+
+    assert (await inbox.get()).content == 1
+    await asyncio.wait_for(blocked, timeout=1)
+    assert (await inbox.get()).content == 2
+
+
+@pytest.mark.asyncio
+async def test_inbox_reject_policy_raises():
+    inbox = AgentInbox("reject", maxsize=1, policy="reject")
+    await inbox.put(_msg(1))
+
+    with pytest.raises(InboxFullError):
+        await inbox.put(_msg(2))
+    assert inbox.rejected == 1
+    assert REGISTRY.get_sample_value("arkhon_agent_inbox_dropped_total", {"agent": "reject", "reason": "rejected"}) == 1
+
+
+@pytest.mark.asyncio
+async def test_inbox_drop_oldest_keeps_higher_priority_messages():
+    inbox = AgentInbox("drop", maxsize=2, policy=BackpressurePolicy.DROP_OLDEST)
+    await inbox.put(_msg("req-1"))
+    await inbox.put(_msg("resp-1", "response"))
+    # Evicts the oldest request, never the response.
+    await inbox.put(_msg("req-2"))
+    assert [(await inbox.get()).content for _ in range(2)] == ["resp-1", "req-2"]
+
+    await inbox.put(_msg("resp-2", "response"))
+    await inbox.put(_msg("resp-3", "response"))
+    # A request cannot displace queued responses, so it is discarded itself.
+    await inbox.put(_msg("req-3"))
+    assert [(await inbox.get()).content for _ in range(2)] == ["resp-2", "resp-3"]
+    assert inbox.dropped == 2
+    assert inbox.empty()
+
+
+@pytest.mark.asyncio
+async def test_inbox_exports_depth_and_wait():
+    inbox = AgentInbox("metrics")
+    await inbox.put(_msg(1))
+    await inbox.put(_msg(2))
+    assert REGISTRY.get_sample_value("arkhon_agent_inbox_depth", {"agent": "metrics"}) == 2
+
+    await inbox.get()
+    assert REGISTRY.get_sample_value("arkhon_agent_inbox_depth", {"agent": "metrics"}) == 1
+    assert REGISTRY.get_sample_value("arkhon_agent_inbox_wait_seconds_count", {"agent": "metrics"}) == 1
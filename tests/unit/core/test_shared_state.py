@@ -1,8 +1,9 @@
 import asyncio
+from contextlib import aclosing
 
 import pytest
 
-from arkhon_rheo.core.shared_state import SharedAgentState
+from arkhon_rheo.core.shared_state import SharedAgentState, UpdateConflictError
 
 
 @pytest.mark.asyncio
@@ -35,3 +36,95 @@ async def test_shared_state_basic_ops():
     await state.update("a", 2)
     val = await state.get("a")
     assert val == 2
+
+
+@pytest.mark.asyncio
+async def test_shared_state_batch_ops():
+    state = SharedAgentState()
+    await state.set_many({"a": 1, "b": 2})
+
+    assert await state.get_many(["a", "b", "missing"]) == {"a": 1, "b": 2, "missing": None}
+
+
+@pytest.mark.asyncio
+async def test_shared_state_key_locks_are_independent_and_released():
+    state = SharedAgentState()
+    entered = asyncio.Event()
+
+    async def hold_a():
+        async with state.lock("a"):
+            entered.set()
+            await asyncio.sleep(0.05)
+
+    holder = asyncio.create_task(hold_a())
+    await entered.wait()
+    # A different key is not blocked by the held lock.
+    async with asyncio.timeout(0.01), state.lock("b"):
+        pass
+    await holder
+
+    assert len(state._locks) == 0
+
+
+@pytest.mark.asyncio
+async def test_shared_state_compare_and_set():
+    state = SharedAgentState()
+    assert await state.get_versioned("k") == (None, 0)
+
+    assert await state.compare_and_set("k", 0, "first")
+    value, version = await state.get_versioned("k")
+    assert (value, version) == ("first", 1)
+
+    await state.set("k", "other")
+    assert not await state.compare_and_set("k", version, "stale")
+    assert await state.get("k") == "other"
+
+
+@pytest.mark.asyncio
+async def test_shared_state_update_with_retries_on_conflict():
+    state = SharedAgentState()
+    await state.set("counter", 0)
+
+    async def slow_increment(value):
+        await asyncio.sleep(0.001)
+        return value + 1
+
+    await asyncio.gather(*(state.update_with("counter", slow_increment, max_retries=50) for _ in range(10)))
+
+    assert await state.get("counter") == 10
+
+
+@pytest.mark.asyncio
+async def test_shared_state_update_with_gives_up():
+    state = SharedAgentState()
+
+    async def always_conflicts(value):
+        await state.set("k", "interference")
+        return value
+
+    with pytest.raises(UpdateConflictError):
+        await state.update_with("k", always_conflicts, max_retries=3)
+
+
+@pytest.mark.asyncio
+async def test_shared_state_watch_yields_changes():
+    state = SharedAgentState()
+    await state.set("status", "idle")
+    seen = []
+
+    async def watcher():
+        async with aclosing(state.watch("status", include_current=True)) as changes:
+            async for value, version in changes:
+                seen.append((value, version))
+                if value == "done":
+                    return
+
+    task = asyncio.create_task(watcher())
+    await asyncio.sleep(0)
+    await state.set("status", "running")
+    await asyncio.sleep(0)
+    await state.set("status", "done")
+    await asyncio.wait_for(task, timeout=1)
+
+    assert seen == [("idle", 1), ("running", 2), ("done", 3)]
+    assert state._watchers == {}
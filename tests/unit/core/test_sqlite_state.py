@@ -0,0 +1,101 @@
+import asyncio
+from contextlib import aclosing
+
+import pytest
+
+from arkhon_rheo.core.shared_state import SharedAgentState
+from arkhon_rheo.core.sqlite_state import SQLiteStateBackend
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "state.db"
+
+
+def test_sqlite_backend_roundtrip_and_versions(db_path):
+    backend = SQLiteStateBackend(db_path)
+    assert backend.get("k") == (None, 0)
+
+    backend.set_many({"k": {"n": 1}, "other": [1, 2]})
+    backend.set_many({"k": {"n": 2}})
+
+    assert backend.get("k") == ({"n": 2}, 2)
+    assert backend.get_many(["k", "other", "missing"]) == {"k": {"n": 2}, "other": [1, 2], "missing": None}
+    assert not backend.compare_and_set("k", 1, "stale")
+    assert backend.compare_and_set("k", 2, "fresh")
+    assert backend.compare_and_set("new", 0, "created")
+    assert backend.get("k") == ("fresh", 3)
+    backend.close()
+
+
+def test_sqlite_backend_changes_since(db_path):
+    writer = SQLiteStateBackend(db_path)
+    reader = SQLiteStateBackend(db_path)
+    cursor, keys = reader.changes_since(None)
+    assert keys == []
+
+    writer.set_many({"a": 1, "b": 2})
+    cursor, keys = reader.changes_since(cursor)
+    assert keys == ["a", "b"]
+
+    writer.set_many({"a": 3})
+    assert reader.changes_since(cursor)[1] == ["a"]
+    writer.close()
+    reader.close()
+
+
+def test_sqlite_backend_lock_lease(db_path):
+    first = SQLiteStateBackend(db_path)
+    second = SQLiteStateBackend(db_path)
+
+    assert first.try_lock("k", "p1", ttl=30)
+    assert not second.try_lock("k", "p2", ttl=30)
+    first.unlock("k", "p1")
+    assert second.try_lock("k", "p2", ttl=0)
+    # An expired lease can be taken over.
+    assert first.try_lock("k", "p1", ttl=30)
+    first.close()
+    second.close()
+
+
+@pytest.mark.asyncio
+async def test_shared_state_over_sqlite_is_shared_between_instances(db_path):
+    # Separate connections behave exactly like separate processes to SQLite.
+    one = SharedAgentState(SQLiteStateBackend(db_path), poll_interval=0.001)
+    two = SharedAgentState(SQLiteStateBackend(db_path), poll_interval=0.001)
+
+    async def increment(state):
+        for _ in range(20):
+            async with state.lock("counter"):
+                value = await state.get("counter")
+                await asyncio.sleep(0)
+                await state.set("counter", (value or 0) + 1)
+
+    await asyncio.gather(increment(one), increment(two))
+
+    assert await two.get("counter") == 40
+    await one.close()
+    await two.close()
+
+
+@pytest.mark.asyncio
+async def test_shared_state_over_sqlite_watch_sees_other_writers(db_path):
+    watcher_state = SharedAgentState(SQLiteStateBackend(db_path), poll_interval=0.001)
+    writer_state = SharedAgentState(SQLiteStateBackend(db_path))
+    seen = []
+
+    async def watcher():
+        async with aclosing(watcher_state.watch("status")) as changes:
+            async for value, _version in changes:
+                seen.append(value)
+                if value == "done":
+                    return
+
+    task = asyncio.create_task(watcher())
+    await asyncio.sleep(0.01)
+    await writer_state.set("status", "done")
+    await asyncio.wait_for(task, timeout=1)
+
+    assert seen == ["done"]
+    await watcher_state.close()
+    await writer_state.close()
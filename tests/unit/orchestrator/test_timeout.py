@@ -8,6 +8,7 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from arkhon_rheo.config.schema import RACIWorkflowConfig
+from arkhon_rheo.core.memory.episodes import EpisodeStore
 from arkhon_rheo.orchestrator.concrete import MetaOrchestrator
 
 
@@ -79,3 +80,36 @@ class TestMetaOrchestratorTimeout:
             state = await orchestrator.run("fast task")
 
         assert state["is_completed"] is True
+
+    @pytest.mark.asyncio
+    async def test_completed_runs_are_recorded_as_episodes(self, tmp_path):
+        """Both finished and timed-out runs are appended to the episode log."""
+        store = EpisodeStore(tmp_path / "episodes.json")
+        orchestrator = MetaOrchestrator(config=RACIWorkflowConfig(), episode_store=store)
+        finished = {
+            "is_completed": True,
+            "errors": [],
+            "messages": [],
+            "shared_context": {"user_request": "fast task", "selected_scheme": "agile", "verdict": "approved"},
+            "next_step": "END",
+            "thread_id": "t-1",
+        }
+
+        async def slow_coro(*_args, **_kwargs):
+            await asyncio.sleep(10)
+
+        with patch(
+            "arkhon_rheo.orchestrator.concrete.meta_orchestrator_graph.ainvoke",
+            AsyncMock(return_value=finished),
+        ):
+            await orchestrator.run("fast task")
+        with patch(
+            "arkhon_rheo.orchestrator.concrete.meta_orchestrator_graph.ainvoke",
+            side_effect=slow_coro,
+        ):
+            await orchestrator.run("slow task", timeout=0.01)
+
+        episodes = store.query()
+        assert [(e.task, e.verdict) for e in episodes] == [("fast task", "approved"), ("slow task", None)]
+        assert store.query(scheme="agile")[0].thread_id == "t-1"
+        store.close()